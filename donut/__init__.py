@@ -1,5 +1,9 @@
+from .cache import CacheStats, MemoryCache, NegativeCache, ResponseCache, SQLiteCache
+from .checkpoint import CrawlCheckpoint
 from .client import DonutClient
-from .errors import DonutAPIError, NotFoundError, ServerError, UnauthorizedError
+from .deals import ListingAlert, UnderpriceDetector
+from .errors import DonutAPIError, IncompleteCrawlError, NotFoundError, RateLimitedError, ServerError, UnauthorizedError
+from .estimation import LeaderboardEstimate, LeaderboardEstimator
 from .helpers import format_number
 from .models import (
     AuctionEntry,
@@ -13,6 +17,7 @@ from .models import (
     LeaderboardResponse,
     LookupResponse,
     LookupResult,
+    ParsedStats,
     PurchaseItem,
     Seller,
     Stats,
@@ -20,7 +25,17 @@ from .models import (
     TransactionHistoryResponse,
     Trim,
 )
+from .models.decode import DecodeMode
+from .models.intern import item_fingerprint
+from .pricing import ItemPrice, PriceIndex
+from .rankindex import PageIndex, RankResult
 from .ratelimit import RateLimiter
+from .refresh import LeaderboardDiff, PlayerChange
+from .scheduler import Scheduler
+from .snapshot import LeaderboardSnapshot, SnapshotBuilder
+from .statstable import StatsTable
+from .txlog import TransactionLog, TransactionLogReader, TransactionRecord
+from .watch import PollCadence, SeenSet
 
 __all__ = [
     "DonutClient",
@@ -28,7 +43,15 @@ __all__ = [
     "UnauthorizedError",
     "NotFoundError",
     "ServerError",
+    "RateLimitedError",
+    "IncompleteCrawlError",
     "RateLimiter",
+    "Scheduler",
+    "ResponseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "CacheStats",
+    "NegativeCache",
     "Seller",
     "Trim",
     "Enchantments",
@@ -46,6 +69,28 @@ __all__ = [
     "LookupResponse",
     "Stats",
     "StatsResponse",
+    "ParsedStats",
+    "StatsTable",
+    "DecodeMode",
+    "LeaderboardSnapshot",
+    "SnapshotBuilder",
+    "CrawlCheckpoint",
+    "LeaderboardEstimate",
+    "LeaderboardEstimator",
+    "PageIndex",
+    "RankResult",
+    "LeaderboardDiff",
+    "PlayerChange",
+    "SeenSet",
+    "PollCadence",
+    "PriceIndex",
+    "ItemPrice",
+    "item_fingerprint",
+    "TransactionLog",
+    "TransactionLogReader",
+    "TransactionRecord",
+    "UnderpriceDetector",
+    "ListingAlert",
     "format_number",
 ]
 
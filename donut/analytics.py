@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:
+    raise ImportError("donut.analytics requires numpy: pip install 'donutsmp-api[analytics]'") from e
+
+from .models import PurchaseItem
+from .models.intern import ItemKey, item_fingerprint
+from .txlog import TransactionLogReader, enchant_value
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+
+class ItemStats(NamedTuple):
+    items: list[ItemKey]
+    sales: IntArray
+    volume: IntArray
+    turnover: FloatArray
+    vwap: FloatArray
+    median: FloatArray
+
+
+class RollingVolume(NamedTuple):
+    start: IntArray
+    sales: IntArray
+    volume: IntArray
+
+
+def _group_order(groups: IntArray, values: FloatArray) -> IntArray:
+    ranks = np.empty(len(values), np.int64)
+    ranks[np.argsort(values)] = np.arange(len(values))
+    return np.argsort(groups * len(values) + ranks)
+
+
+def _group_bounds(codes: IntArray) -> tuple[IntArray, IntArray]:
+    if not len(codes):
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    return starts, np.r_[starts[1:], len(codes)]
+
+
+def _grouped_percentile(sorted_values: FloatArray, starts: IntArray, ends: IntArray, q: float) -> FloatArray:
+    position = starts + (ends - starts - 1) * (q / 100)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, ends - 1)
+    weight = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * weight
+
+
+class TransactionFrame:
+    def __init__(self, sold_at: IntArray, price: FloatArray, quantity: IntArray, item: IntArray, items: list[ItemKey]):
+        self.sold_at = sold_at
+        self.price = price
+        self.quantity = quantity
+        self.item = item
+        self.items = items
+        self.codes = {key: code for code, key in enumerate(items)}
+        self.unit_price: FloatArray = price / np.maximum(quantity, 1)
+        self._sorted: tuple[IntArray, IntArray, IntArray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @classmethod
+    def from_purchases(cls, purchases: Iterable[PurchaseItem | dict[str, Any]]) -> TransactionFrame:
+        codes: dict[ItemKey, int] = {}
+        sold_at, price, quantity, item = [], [], [], []
+        for purchase in purchases:
+            if isinstance(purchase, dict):
+                purchase = PurchaseItem.model_validate(purchase)
+            sold_at.append(purchase.unixMillisDateSold or 0)
+            price.append(purchase.price or 0.0)
+            quantity.append((purchase.item.count if purchase.item else None) or 1)
+            item.append(codes.setdefault(item_fingerprint(purchase.item), len(codes)))
+        return cls(
+            np.array(sold_at, np.int64), np.array(price, np.float64), np.array(quantity, np.int64), np.array(item, np.int64), list(codes)
+        )
+
+    @classmethod
+    def from_log(cls, log: TransactionLogReader | str | Path, start: int | None = None, end: int | None = None) -> TransactionFrame:
+        reader = log if isinstance(log, TransactionLogReader) else TransactionLogReader(log)
+        codes: dict[ItemKey, int] = {}
+        sold_at, price, quantity, item = [], [], [], []
+        try:
+            for block in reader.blocks_between(start, end):
+                data = reader.read_block(block)
+                local_item = np.frombuffer(data.columns["item"], np.uint32).astype(np.int64)
+                local_enchants = np.frombuffer(data.columns["enchants"], np.uint32).astype(np.int64)
+                width = len(data.enchants)
+                pairs, inverse = np.unique(local_item * width + local_enchants, return_inverse=True)
+                keys = [(data.items[pair // width] or None, *enchant_value(data.enchants[pair % width])) for pair in pairs.tolist()]
+                mapping = np.array([codes.setdefault(key, len(codes)) for key in keys], np.int64)
+                times = np.frombuffer(data.columns["sold_at"], np.int64)
+                mask = np.ones(block.rows, bool)
+                if start is not None:
+                    mask &= times >= start
+                if end is not None:
+                    mask &= times < end
+                sold_at.append(times[mask])
+                price.append(np.frombuffer(data.prices, np.float64)[mask])
+                quantity.append(np.frombuffer(data.columns["count"], np.uint32).astype(np.int64)[mask])
+                item.append(mapping[inverse.reshape(-1)][mask])
+        finally:
+            if reader is not log:
+                reader.close()
+        if not sold_at:
+            empty = np.empty(0, np.int64)
+            return cls(empty, np.empty(0, np.float64), empty, empty, [])
+        return cls(np.concatenate(sold_at), np.concatenate(price), np.concatenate(quantity), np.concatenate(item), list(codes))
+
+    def _by_item(self) -> tuple[IntArray, IntArray, IntArray]:
+        if self._sorted is None:
+            order = _group_order(self.item, self.unit_price)
+            starts, ends = _group_bounds(self.item[order])
+            self._sorted = order, starts, ends
+        return self._sorted
+
+    def item_stats(self) -> ItemStats:
+        order, starts, ends = self._by_item()
+        quantity = self.quantity[order]
+        volume = np.add.reduceat(quantity, starts) if len(starts) else np.empty(0, np.int64)
+        turnover = np.add.reduceat(self.price[order], starts) if len(starts) else np.empty(0, np.float64)
+        return ItemStats(
+            items=[self.items[code] for code in self.item[order][starts].tolist()],
+            sales=ends - starts,
+            volume=volume,
+            turnover=turnover,
+            vwap=turnover / np.maximum(volume, 1),
+            median=_grouped_percentile(self.unit_price[order], starts, ends, 50),
+        )
+
+    def percentile(self, q: float) -> FloatArray:
+        if not 0 <= q <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        order, starts, ends = self._by_item()
+        return _grouped_percentile(self.unit_price[order], starts, ends, q)
+
+    def rolling_volume(self, window: int, step: int, item: ItemKey | None = None) -> RollingVolume:
+        if item is None:
+            times, quantity = self.sold_at, self.quantity
+        elif item in self.codes:
+            mask = self.item == self.codes[item]
+            times, quantity = self.sold_at[mask], self.quantity[mask]
+        else:
+            times = quantity = np.empty(0, np.int64)
+        if not len(times):
+            empty = np.empty(0, np.int64)
+            return RollingVolume(empty, empty, empty)
+        origin = int(times.min()) // step * step
+        bins = (times - origin) // step
+        sales = np.bincount(bins)
+        volume = np.bincount(bins, weights=quantity).astype(np.int64)
+        width = max(window // step, 1)
+        kernel = np.ones(width, np.int64)
+        return RollingVolume(
+            origin + np.arange(len(sales), dtype=np.int64) * step,
+            np.convolve(sales, kernel)[:len(sales)],
+            np.convolve(volume, kernel)[:len(volume)],
+        )
+
+    def outliers(self, threshold: float = 3.5) -> npt.NDArray[np.bool_]:
+        order, starts, ends = self._by_item()
+        prices = self.unit_price[order]
+        sizes = ends - starts
+        medians = np.repeat(_grouped_percentile(prices, starts, ends, 50), sizes)
+        deviation = np.abs(prices - medians)
+        group = np.repeat(np.arange(len(starts)), sizes)
+        deviation_order = _group_order(group, deviation)
+        mad = np.repeat(_grouped_percentile(deviation[deviation_order], starts, ends, 50), sizes)
+        score = np.divide(deviation, 1.4826 * mad, out=np.zeros_like(deviation), where=mad > 0)
+        mask = np.zeros(len(self), bool)
+        mask[order] = score > threshold
+        return mask
+
+
+def benchmark(rows: int = 2_000_000, items: int = 2_000, seed: int = 0) -> dict[str, float]:
+    rng = np.random.default_rng(seed)
+    item = rng.integers(0, items, rows)
+    frame = TransactionFrame(
+        np.sort(rng.integers(1_700_000_000_000, 1_700_000_000_000 + 30 * 86_400_000, rows)),
+        rng.lognormal(10, 1, rows) * (item + 1),
+        rng.integers(1, 65, rows),
+        item,
+        [(f"minecraft:item{i}", (), None, None) for i in range(items)],
+    )
+    timings: dict[str, float] = {}
+    for name, run in (
+        ("item_stats", frame.item_stats),
+        ("p90", lambda: frame.percentile(90)),
+        ("rolling_volume", lambda: frame.rolling_volume(3_600_000, 60_000)),
+        ("outliers", frame.outliers),
+    ):
+        started = time.perf_counter()
+        run()
+        timings[name] = rows / (time.perf_counter() - started)
+    return timings
+
+
+if __name__ == "__main__":
+    for name, throughput in benchmark().items():
+        print(f"{name}: {throughput / 1e6:,.1f}M rows/s")
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Protocol
+
+import orjson
+
+DEFAULT_POLICIES: dict[str, float] = {
+    "/v1/auction/transactions/*": 5,
+    "/v1/auction/list/*": 10,
+    "/v1/leaderboards/*": 300,
+    "/v1/lookup/*": 600,
+    "/v1/stats/*": 900,
+}
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCache:
+    def __init__(self, max_entries: int = 10_000):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCache:
+    def __init__(self, path: str | Path, max_entries: int = 100_000):
+        self._max_entries = max_entries
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB, expires REAL, accessed REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.commit()
+        self._writes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        count: int = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return count
+
+    def get(self, key: str) -> bytes | None:
+        row = self._conn.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if row[1] <= now:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        value: bytes = row[0]
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (key, value, now + ttl, now))
+        self._writes += 1
+        if self._writes % 256 == 0:
+            self._evict(now)
+        self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        overflow = len(self) - self._max_entries
+        if overflow > 0:
+            self._conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            overflow = len(self) - self._max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed LIMIT ?)", (overflow,)
+            )
+            self.evictions += overflow
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class NegativeCache:
+    def __init__(
+        self,
+        ttl: float = 86_400,
+        backend: CacheBackend | None = None,
+        patterns: tuple[str, ...] = ("/v1/stats/*", "/v1/lookup/*"),
+    ):
+        self.ttl = ttl
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache(max_entries=100_000)
+        self.patterns = patterns
+        self.hits = 0
+
+    def applies_to(self, endpoint: str) -> bool:
+        return any(fnmatchcase(endpoint, pattern) for pattern in self.patterns)
+
+    def __contains__(self, endpoint: str) -> bool:
+        if self.backend.get(f"404 {endpoint}") is None:
+            return False
+        self.hits += 1
+        return True
+
+    def add(self, endpoint: str) -> None:
+        self.backend.set(f"404 {endpoint}", b"", self.ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"hits={self.hits} misses={self.misses} hit_rate={self.hit_rate:.1%}"
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        policies: dict[str, float] | None = None,
+        default_ttl: float = 0,
+    ):
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+
+    def ttl_for(self, endpoint: str) -> float:
+        return next((ttl for pattern, ttl in self.policies.items() if fnmatchcase(endpoint, pattern)), self.default_ttl)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        value = self.backend.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        result: dict[str, Any] = orjson.loads(value)
+        return result
+
+    def set(self, key: str, data: dict[str, Any], ttl: float) -> None:
+        if ttl > 0:
+            self.backend.set(key, orjson.dumps(data), ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Any
+
+import orjson
+
+
+class CrawlCheckpoint:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file: IO[bytes] | None = None
+
+    def load(self) -> tuple[dict[int, dict[str, Any]], int | None]:
+        pages: dict[int, dict[str, Any]] = {}
+        end: int | None = None
+        if not self.path.exists():
+            return pages, end
+        with self.path.open("rb") as f:
+            for line in f:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if "end" in record:
+                    end = record["end"] if end is None else min(end, record["end"])
+                elif "page" in record:
+                    pages[record["page"]] = {"result": record.get("result")}
+        if end is not None:
+            pages = {page: data for page, data in pages.items() if page < end}
+        return pages, end
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+        self._file.write(orjson.dumps(record) + b"\n")
+        self._file.flush()
+
+    def record_page(self, page: int, data: dict[str, Any]) -> None:
+        self._write({"page": page, "result": data.get("result")})
+
+    def record_end(self, page: int) -> None:
+        self._write({"end": page})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
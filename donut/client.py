@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .cache import NegativeCache, ResponseCache
 from .endpoints import (
     AuctionEndpoint,
     LeaderboardsEndpoint,
@@ -16,8 +17,16 @@ class DonutClient:
         self,
         api_keys: str | list[str],
         timeout: float = 30.0,
+        max_retries: int = 5,
+        requests_per_minute: int | dict[str, int] = 250,
+        max_in_flight: int = 100,
+        cache: ResponseCache | None = None,
+        negative_cache: NegativeCache | None = None,
     ):
-        self._http = HTTPClient(api_keys, timeout)
+        self._http = HTTPClient(
+            api_keys, timeout, max_retries, requests_per_minute, max_in_flight, cache, negative_cache
+        )
+        self.cache = cache
         self.auction = AuctionEndpoint(self._http)
         self.leaderboards = LeaderboardsEndpoint(self._http)
         self.lookup = LookupEndpoint(self._http)
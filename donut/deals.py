@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+from .helpers import format_number
+from .models import AuctionEntry
+from .models.intern import ItemKey, item_fingerprint
+from .pricing import PriceIndex
+
+
+class ListingAlert(BaseModel):
+    item: ItemKey
+    price: float
+    unit_price: float
+    limit: float
+    seller: str | None = None
+    observed_at: float
+    latency: float
+    raw: dict[str, Any]
+
+    @property
+    def listing(self) -> AuctionEntry:
+        return AuctionEntry.model_validate(self.raw)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.item[0]} at {format_number(self.unit_price)} (limit {format_number(self.limit)}) "
+            f"by {self.seller or 'Unknown'}, {self.latency * 1000:.1f}ms after observation"
+        )
+
+
+class UnderpriceDetector:
+    def __init__(
+        self,
+        thresholds: Mapping[Any, float] | None = None,
+        reference: PriceIndex | Mapping[Any, float] | None = None,
+        discount: float = 0.7,
+    ):
+        self.thresholds = thresholds or {}
+        self.reference = reference
+        self.discount = discount
+        self.checked = 0
+        self.alerts = 0
+
+    def _lookup(self, table: Mapping[Any, float], item: ItemKey) -> float | None:
+        value = table.get(item)
+        return value if value is not None else table.get(item[0])
+
+    def limit_for(self, item: ItemKey) -> float | None:
+        limit = self._lookup(self.thresholds, item)
+        if isinstance(self.reference, PriceIndex):
+            reference = self.reference.median_sale(item)
+        elif self.reference is not None:
+            reference = self._lookup(self.reference, item)
+        else:
+            reference = None
+        if reference is not None:
+            limit = max(limit or 0.0, reference * self.discount)
+        return limit
+
+    def check(self, raw: dict[str, Any], observed: float) -> ListingAlert | None:
+        self.checked += 1
+        price = raw.get("price")
+        if price is None:
+            return None
+        item = raw.get("item") or {}
+        fingerprint = item_fingerprint(item or None)
+        limit = self.limit_for(fingerprint)
+        unit_price = price / (item.get("count") or 1)
+        if limit is None or unit_price >= limit:
+            return None
+        self.alerts += 1
+        return ListingAlert(
+            item=fingerprint,
+            price=price,
+            unit_price=unit_price,
+            limit=limit,
+            seller=(raw.get("seller") or {}).get("name"),
+            observed_at=time.time() - (time.monotonic() - observed),
+            latency=time.monotonic() - observed,
+            raw=raw,
+        )
@@ -1,86 +1,736 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
-
+import math
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, get_args, overload
+
+from ..checkpoint import CrawlCheckpoint
+from ..deals import ListingAlert, UnderpriceDetector
+from ..errors import IncompleteCrawlError, NotFoundError
+from ..estimation import LeaderboardEstimate, LeaderboardEstimator
+from ..http import RETRYABLE_ERRORS
 from ..models import (
+    AuctionEntry,
     AuctionRequestBody,
     AuctionResponse,
     AuctionSort,
     LeaderboardResponse,
+    ListResponse,
     LookupResponse,
+    PurchaseItem,
     StatsResponse,
     TransactionHistoryResponse,
 )
+from ..models.decode import DecodeMode
+from ..rankindex import PageIndex, RankResult
+from ..refresh import LeaderboardDiff, diff_rows, dirty_pages, ranked, sample_pages
+from ..snapshot import PAGE_SIZE, LeaderboardSnapshot, SnapshotBuilder, page_rows
+from ..watch import PollCadence, SeenSet, listing_key, poll_new, sold_at, transaction_key
 
 if TYPE_CHECKING:
     from ..http import HTTPClient
+    from ..scheduler import Priority
 
 LeaderboardCategory = Literal[
     "money", "shards", "playtime", "kills", "deaths",
     "mobskilled", "brokenblocks", "placedblocks", "sell", "shop"
 ]
 
+CATEGORY_STATS: dict[str, str] = {
+    "money": "money", "shards": "shards", "playtime": "playtime", "kills": "kills", "deaths": "deaths",
+    "mobskilled": "mobs_killed", "brokenblocks": "broken_blocks", "placedblocks": "placed_blocks",
+    "sell": "money_made_from_sell", "shop": "money_spent_on_shop",
+}
+
 T = TypeVar("T")
 U = TypeVar("U")
+P = TypeVar("P")
+R = TypeVar("R", LookupResponse, StatsResponse)
+
+
+def normalize_username(username: str) -> str:
+    return username.strip().lower()
+
+
+def group_usernames(usernames: Iterable[str]) -> dict[str, list[str]]:
+    groups: dict[str, list[str]] = {}
+    for username in usernames:
+        groups.setdefault(normalize_username(username), []).append(username)
+    return groups
+
+
+async def stream_completed(
+    items: Iterable[T],
+    fetch: Callable[[T], Awaitable[U]],
+    buffer: int = 100,
+) -> AsyncIterator[tuple[T, U]]:
+    async def run(item: T) -> tuple[T, U]:
+        return item, await fetch(item)
+
+    source = iter(items)
+    pending: set[asyncio.Task[tuple[T, U]]] = set()
+    try:
+        while True:
+            for item in source:
+                pending.add(asyncio.ensure_future(run(item)))
+                if len(pending) >= buffer:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def results(response: ListResponse[T] | dict[str, Any]) -> list[T]:
+    return (response.get("result") or []) if isinstance(response, dict) else list(response)
+
+
+def missing(model: type[R], decode: DecodeMode) -> R | dict[str, Any]:
+    data = {"status": 404}
+    return data if decode == "raw" else model.model_validate(data)
 
 
-async def run_batched(
-    items: list[T],
-    keys: list[list[str]],
-    fetch: Callable[[T, str], Awaitable[U]],
-) -> list[U]:
-    results: list[U] = []
-    offset = 0
-    for i, batch_keys in enumerate(keys):
-        batch_items = items[offset:offset + len(batch_keys)]
-        if i > 0:
-            await asyncio.sleep(65)
-        batch_results = await asyncio.gather(*[fetch(item, key) for item, key in zip(batch_items, batch_keys, strict=True)])
-        results.extend(batch_results)
-        offset += len(batch_keys)
-    return results
+def with_username(response: StatsResponse | dict[str, Any], username: str) -> StatsResponse | dict[str, Any]:
+    if isinstance(response, dict):
+        if response.get("result"):
+            return {**response, "result": {**response["result"], "username": username}}
+    elif response.result:
+        return response.model_copy(update={"result": response.result.model_copy(update={"username": username})})
+    return response
+
+
+async def batch_players(
+    usernames: list[str], fetch: Callable[[str], Awaitable[P]], respell: Callable[[P, str], P] | None = None
+) -> list[P]:
+    groups = group_usernames(usernames)
+    by_name = dict(zip(groups, await asyncio.gather(*map(fetch, groups)), strict=True))
+    if respell is None:
+        return [by_name[normalize_username(username)] for username in usernames]
+    return [respell(by_name[normalize_username(username)], username) for username in usernames]
+
+
+async def stream_players(
+    usernames: Iterable[str], fetch: Callable[[str], Awaitable[P]], buffer: int, respell: Callable[[P, str], P] | None = None
+) -> AsyncIterator[tuple[str, P]]:
+    groups = group_usernames(usernames)
+    async for name, result in stream_completed(groups, fetch, buffer):
+        for username in groups[name]:
+            yield username, result if respell is None else respell(result, username)
+
+
+class RequestCounter:
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
 
 
 class AuctionEndpoint:
     def __init__(self, http: HTTPClient):
         self._http = http
 
+    @overload
     async def list(
-        self, page: int = 1, search: str | None = None, sort: AuctionSort | None = None
-    ) -> AuctionResponse:
-        body = AuctionRequestBody(search=search, sort=sort)
-        data = await self._http.get(f"/v1/auction/list/{page}", json=body.model_dump(exclude_none=True))
-        return AuctionResponse.model_validate(data)
+        self,
+        page: int = 1,
+        search: str | None = None,
+        sort: AuctionSort | None = None,
+        priority: Priority = "interactive",
+        decode: Literal["validated"] = "validated",
+    ) -> AuctionResponse: ...
+
+    @overload
+    async def list(
+        self,
+        page: int = 1,
+        search: str | None = None,
+        sort: AuctionSort | None = None,
+        priority: Priority = "interactive",
+        *,
+        decode: Literal["raw"],
+    ) -> dict[str, Any]: ...
 
-    async def transactions(self, page: int = 1) -> TransactionHistoryResponse:
-        data = await self._http.get(f"/v1/auction/transactions/{page}")
-        return TransactionHistoryResponse.model_validate(data)
+    async def list(
+        self,
+        page: int = 1,
+        search: str | None = None,
+        sort: AuctionSort | None = None,
+        priority: Priority = "interactive",
+        decode: DecodeMode = "validated",
+    ) -> AuctionResponse | dict[str, Any]:
+        body = AuctionRequestBody(search=search, sort=sort)
+        return await self._http.get_model(
+            AuctionResponse, f"/v1/auction/list/{page}", json=body.model_dump(exclude_none=True), priority=priority, decode=decode
+        )
+
+    @overload
+    async def transactions(
+        self, page: int = 1, priority: Priority = "interactive", decode: Literal["validated"] = "validated"
+    ) -> TransactionHistoryResponse: ...
+
+    @overload
+    async def transactions(self, page: int = 1, priority: Priority = "interactive", *, decode: Literal["raw"]) -> dict[str, Any]: ...
+
+    async def transactions(
+        self, page: int = 1, priority: Priority = "interactive", decode: DecodeMode = "validated"
+    ) -> TransactionHistoryResponse | dict[str, Any]:
+        return await self._http.get_model(
+            TransactionHistoryResponse, f"/v1/auction/transactions/{page}", priority=priority, decode=decode
+        )
+
+    @overload
+    def search_all(
+        self,
+        search: str | None = None,
+        sort: AuctionSort | None = None,
+        limit: int | None = None,
+        predicate: Callable[[AuctionEntry], bool] | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        concurrency: int = 8,
+        max_pages: int | None = None,
+        decode: Literal["validated"] = "validated",
+    ) -> AsyncIterator[AuctionEntry]: ...
+
+    @overload
+    def search_all(
+        self,
+        search: str | None = None,
+        sort: AuctionSort | None = None,
+        limit: int | None = None,
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        concurrency: int = 8,
+        max_pages: int | None = None,
+        *,
+        decode: Literal["raw"],
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    async def search_all(
+        self,
+        search: str | None = None,
+        sort: AuctionSort | None = None,
+        limit: int | None = None,
+        predicate: Callable[[Any], bool] | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        concurrency: int = 8,
+        max_pages: int | None = None,
+        decode: DecodeMode = "validated",
+    ) -> AsyncIterator[AuctionEntry | dict[str, Any]]:
+        pending: dict[int, asyncio.Task[list[Any]]] = {}
+        next_page = page = 1
+        found = 0
+
+        async def fetch(page: int) -> list[Any]:
+            return results(await self.list(page, search, sort, "bulk", decode=decode))
+
+        try:
+            while limit is None or found < limit:
+                while len(pending) < concurrency and (max_pages is None or next_page <= max_pages):
+                    pending[next_page] = asyncio.ensure_future(fetch(next_page))
+                    next_page += 1
+                if page not in pending:
+                    return
+                entries = await pending.pop(page)
+                page += 1
+                if not entries:
+                    return
+                for entry in entries:
+                    price = (entry.get("price") if isinstance(entry, dict) else entry.price) or 0.0
+                    if (sort == "lowest_price" and max_price is not None and price > max_price) or (
+                        sort == "highest_price" and min_price is not None and price < min_price
+                    ):
+                        return
+                    if (min_price is not None and price < min_price) or (max_price is not None and price > max_price):
+                        continue
+                    if predicate is None or predicate(entry):
+                        yield entry
+                        found += 1
+                        if limit is not None and found >= limit:
+                            return
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+    def _cadence(self, cadence: PollCadence | float | None) -> PollCadence:
+        if not isinstance(cadence, PollCadence):
+            cadence = PollCadence() if cadence is None else PollCadence.fixed(cadence)
+        cadence.bind(self._http.requests_per_second)
+        return cadence
+
+    @overload
+    def watch_transactions(
+        self,
+        cadence: PollCadence | float | None = None,
+        max_pages: int = 5,
+        seen: SeenSet | None = None,
+        decode: Literal["validated"] = "validated",
+    ) -> AsyncIterator[PurchaseItem]: ...
+
+    @overload
+    def watch_transactions(
+        self,
+        cadence: PollCadence | float | None = None,
+        max_pages: int = 5,
+        seen: SeenSet | None = None,
+        *,
+        decode: Literal["raw"],
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    def watch_transactions(
+        self,
+        cadence: PollCadence | float | None = None,
+        max_pages: int = 5,
+        seen: SeenSet | None = None,
+        decode: DecodeMode = "validated",
+    ) -> AsyncIterator[PurchaseItem | dict[str, Any]]:
+        async def fetch(page: int) -> list[Any]:
+            return results(await self.transactions(page, "bulk", decode=decode))
+
+        return poll_new(fetch, transaction_key, self._cadence(cadence), seen or SeenSet(), max_pages, sold_at)
+
+    @overload
+    def watch_listings(
+        self,
+        search: str | None = None,
+        sort: AuctionSort = "recently_listed",
+        cadence: PollCadence | float | None = None,
+        max_pages: int = 5,
+        seen: SeenSet | None = None,
+        decode: Literal["validated"] = "validated",
+    ) -> AsyncIterator[AuctionEntry]: ...
+
+    @overload
+    def watch_listings(
+        self,
+        search: str | None = None,
+        sort: AuctionSort = "recently_listed",
+        cadence: PollCadence | float | None = None,
+        max_pages: int = 5,
+        seen: SeenSet | None = None,
+        *,
+        decode: Literal["raw"],
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    def watch_listings(
+        self,
+        search: str | None = None,
+        sort: AuctionSort = "recently_listed",
+        cadence: PollCadence | float | None = None,
+        max_pages: int = 5,
+        seen: SeenSet | None = None,
+        decode: DecodeMode = "validated",
+    ) -> AsyncIterator[AuctionEntry | dict[str, Any]]:
+        async def fetch(page: int) -> list[Any]:
+            return results(await self.list(page, search, sort, "bulk", decode=decode))
+
+        return poll_new(fetch, listing_key, self._cadence(cadence), seen or SeenSet(max_age=3600), max_pages)
+
+    async def watch_underpriced(
+        self,
+        detector: UnderpriceDetector,
+        search: str | None = None,
+        cadence: PollCadence | float | None = None,
+        max_pages: int = 3,
+        seen: SeenSet | None = None,
+    ) -> AsyncIterator[ListingAlert]:
+        async def fetch(page: int) -> list[tuple[float, dict[str, Any]]]:
+            response = await self.list(page, search, "recently_listed", "bulk", decode="raw")
+            observed = time.monotonic()
+            return [(observed, raw) for raw in response.get("result") or []]
+
+        listings = poll_new(fetch, lambda pair: listing_key(pair[1]), self._cadence(cadence), seen or SeenSet(max_age=3600), max_pages)
+        async for observed, raw in listings:
+            alert = detector.check(raw, observed)
+            if alert is not None:
+                yield alert
 
 
 class LeaderboardsEndpoint:
-    def __init__(self, http: HTTPClient):
+    def __init__(self, http: HTTPClient, index: PageIndex | None = None):
         self._http = http
+        self.index = index if index is not None else PageIndex()
+
+    async def _fetch(
+        self, category: LeaderboardCategory, page: int, priority: Priority = "bulk", decode: DecodeMode = "validated"
+    ) -> LeaderboardResponse | dict[str, Any]:
+        return await self._http.get_model(
+            LeaderboardResponse, f"/v1/leaderboards/{category}/{page}", priority=priority, decode=decode
+        )
 
-    async def __call__(self, category: LeaderboardCategory, page: int = 1) -> LeaderboardResponse:
-        data = await self._http.get(f"/v1/leaderboards/{category}/{page}")
-        return LeaderboardResponse.model_validate(data)
+    @overload
+    async def __call__(
+        self, category: LeaderboardCategory, page: int = 1, decode: Literal["validated"] = "validated"
+    ) -> LeaderboardResponse: ...
 
+    @overload
+    async def __call__(self, category: LeaderboardCategory, page: int = 1, *, decode: Literal["raw"]) -> dict[str, Any]: ...
+
+    async def __call__(
+        self, category: LeaderboardCategory, page: int = 1, decode: DecodeMode = "validated"
+    ) -> LeaderboardResponse | dict[str, Any]:
+        return await self._fetch(category, page, "interactive", decode)
+
+    @overload
     async def batch(
         self,
         category: LeaderboardCategory,
         start_page: int = 1,
         end_page: int = 10,
-    ) -> list[LeaderboardResponse]:
-        pages = list(range(start_page, end_page + 1))
-        keys = self._http._rate_limiter.distribute(len(pages))
+        decode: Literal["validated"] = "validated",
+    ) -> list[LeaderboardResponse]: ...
 
-        async def fetch(page: int, key: str) -> LeaderboardResponse:
-            data = await self._http.get_with_key(f"/v1/leaderboards/{category}/{page}", key)
-            return LeaderboardResponse.model_validate(data)
+    @overload
+    async def batch(
+        self,
+        category: LeaderboardCategory,
+        start_page: int = 1,
+        end_page: int = 10,
+        *,
+        decode: Literal["raw"],
+    ) -> list[dict[str, Any]]: ...
 
-        return await run_batched(pages, keys, fetch)
+    async def batch(
+        self,
+        category: LeaderboardCategory,
+        start_page: int = 1,
+        end_page: int = 10,
+        decode: DecodeMode = "validated",
+    ) -> list[Any]:
+        pages = range(start_page, end_page + 1)
+        return list(await asyncio.gather(*[self._fetch(category, page, decode=decode) for page in pages]))
+
+    @overload
+    def stream(
+        self,
+        category: LeaderboardCategory,
+        start_page: int = 1,
+        end_page: int = 10,
+        buffer: int = 100,
+        decode: Literal["validated"] = "validated",
+    ) -> AsyncIterator[tuple[int, LeaderboardResponse]]: ...
+
+    @overload
+    def stream(
+        self,
+        category: LeaderboardCategory,
+        start_page: int = 1,
+        end_page: int = 10,
+        buffer: int = 100,
+        *,
+        decode: Literal["raw"],
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]: ...
+
+    def stream(
+        self,
+        category: LeaderboardCategory,
+        start_page: int = 1,
+        end_page: int = 10,
+        buffer: int = 100,
+        decode: DecodeMode = "validated",
+    ) -> AsyncIterator[tuple[int, LeaderboardResponse | dict[str, Any]]]:
+        return stream_completed(range(start_page, end_page + 1), lambda page: self._fetch(category, page, decode=decode), buffer)
+
+    async def snapshot(
+        self,
+        category: LeaderboardCategory,
+        start_page: int = 1,
+        end_page: int = 10,
+        buffer: int = 100,
+    ) -> LeaderboardSnapshot:
+        return await LeaderboardSnapshot.from_stream(self.stream(category, start_page, end_page, buffer, decode="raw"), category)
+
+    async def snapshot_all(
+        self,
+        categories: Iterable[LeaderboardCategory] | None = None,
+        pages: int | dict[LeaderboardCategory, int] | None = None,
+        buffer: int = 100,
+        progress: Callable[[LeaderboardCategory, int, int], None] | None = None,
+    ) -> dict[LeaderboardCategory, LeaderboardSnapshot]:
+        selected = list(dict.fromkeys(categories if categories is not None else get_args(LeaderboardCategory)))
+        if pages is None:
+            counts = dict(zip(selected, await asyncio.gather(*[self.page_count(c) for c in selected]), strict=True))
+        elif isinstance(pages, int):
+            counts = dict.fromkeys(selected, pages)
+        else:
+            counts = {category: pages[category] for category in selected}
+
+        builders = {category: SnapshotBuilder(category) for category in selected}
+        interleaved = [
+            (category, page)
+            for page in range(1, max(counts.values(), default=0) + 1)
+            for category in selected
+            if page <= counts[category]
+        ]
+
+        async def fetch(item: tuple[LeaderboardCategory, int]) -> dict[str, Any]:
+            category, page = item
+            return await self._http.get(f"/v1/leaderboards/{category}/{page}", priority="bulk")
+
+        async for (category, page), data in stream_completed(interleaved, fetch, buffer):
+            builders[category].add(page, data)
+            if progress is not None:
+                progress(category, len(builders[category]), counts[category])
+        return {category: builder.build() for category, builder in builders.items()}
+
+    async def _page_rows(
+        self, category: LeaderboardCategory, page: int, priority: Priority = "interactive", counter: RequestCounter | None = None
+    ) -> list[tuple[str, str, float]]:
+        if counter is not None:
+            counter.count += 1
+        rows = list(page_rows(await self._http.get(f"/v1/leaderboards/{category}/{page}", priority=priority)))
+        if rows:
+            self.index.record(category, page, rows[0][2], rows[-1][2], len(rows))
+        return rows
+
+    async def _has_entries(self, category: LeaderboardCategory, page: int, counter: RequestCounter | None = None) -> bool:
+        return bool(await self._page_rows(category, page, counter=counter))
+
+    async def _gallop(self, category: LeaderboardCategory, low: int, counter: RequestCounter | None) -> tuple[int, int]:
+        high = low * 2
+        while await self._has_entries(category, high, counter):
+            low, high = high, high * 2
+        return low, high
+
+    async def page_count(self, category: LeaderboardCategory, ttl: float = 300) -> int:
+        return await self._page_count(category, ttl)
+
+    async def _page_count(self, category: LeaderboardCategory, ttl: float, counter: RequestCounter | None = None) -> int:
+        cached = self.index.page_count(category, ttl)
+        if cached is not None:
+            return cached
+
+        hint = self.index.page_count(category) or 0
+        if hint and await self._has_entries(category, hint, counter):
+            low, high = await self._gallop(category, hint, counter)
+        elif hint != 1 and await self._has_entries(category, 1, counter):
+            low, high = (1, hint) if hint > 1 else await self._gallop(category, 1, counter)
+        else:
+            low = high = 0
+        while high - low > 1:
+            mid = (low + high) // 2
+            if await self._has_entries(category, mid, counter):
+                low = mid
+            else:
+                high = mid
+
+        self.index.record_page_count(category, low)
+        return low
+
+    async def rank_of(
+        self,
+        category: LeaderboardCategory,
+        value: float | None = None,
+        username: str | None = None,
+        exact: bool = True,
+    ) -> RankResult | None:
+        if (value is None) == (username is None):
+            raise ValueError("Pass exactly one of value or username")
+        fetched: dict[int, list[tuple[str, str, float]]] = {}
+        counter = RequestCounter()
+
+        async def rows(page: int) -> list[tuple[str, str, float]]:
+            if page not in fetched:
+                fetched[page] = await self._page_rows(category, page, counter=counter)
+            return fetched[page]
+
+        if username is not None:
+            try:
+                data = await self._http.get(f"/v1/stats/{normalize_username(username)}")
+            except NotFoundError:
+                return None
+            counter.count += 1
+            stat = (data.get("result") or {}).get(CATEGORY_STATS[category])
+            try:
+                value = float(stat) if stat is not None else None
+            except ValueError:
+                value = None
+            if value is None:
+                return None
+
+        result = await self._rank_for_value(category, float(value or 0), exact, rows, fetched, counter)
+        found = result if username is None else await self._find_username(category, username, result, rows)
+        self.index.save()
+        if found is not None:
+            found.requests = counter.count
+        return found
+
+    async def _rank_for_value(
+        self,
+        category: LeaderboardCategory,
+        value: float,
+        exact: bool,
+        rows: Callable[[int], Awaitable[list[tuple[str, str, float]]]],
+        fetched: dict[int, list[tuple[str, str, float]]],
+        counter: RequestCounter,
+    ) -> RankResult:
+        pages = await self._page_count(category, self.index.ttl, counter)
+        low, high = self.index.bracket(category, value, pages)
+        while high - low > 1:
+            mid = (low + high) // 2
+            mid_rows = await rows(mid)
+            if mid_rows and mid_rows[-1][2] > value:
+                low = mid
+            else:
+                high = mid
+
+        if high > pages:
+            last = self.index.get(category, pages)
+            entries = last.entries if last is not None else len(await rows(pages))
+            return RankResult(category=category, rank=(pages - 1) * PAGE_SIZE + entries + 1, value=value, page=pages)
+
+        first_rank = (high - 1) * PAGE_SIZE + 1
+        bounds = self.index.get(category, high)
+        if bounds is not None and bounds.first <= value:
+            return RankResult(category=category, rank=first_rank, value=value, page=high)
+        if exact or bounds is None or high in fetched:
+            above = sum(1 for _, _, v in await rows(high) if v > value)
+            return RankResult(category=category, rank=first_rank + above, value=value, page=high)
+        span = bounds.first - bounds.last
+        above = math.floor((bounds.first - value) / span * (bounds.entries - 1)) + 1 if span > 0 else bounds.entries
+        return RankResult(category=category, rank=first_rank + above, value=value, page=high, exact=False)
+
+    async def _find_username(
+        self,
+        category: LeaderboardCategory,
+        username: str,
+        result: RankResult,
+        rows: Callable[[int], Awaitable[list[tuple[str, str, float]]]],
+    ) -> RankResult | None:
+        name = normalize_username(username)
+        for page in (result.page, result.page - 1, result.page + 1):
+            if page < 1:
+                continue
+            for i, (entry_name, _, entry_value) in enumerate(await rows(page)):
+                if entry_name.lower() == name:
+                    rank = (page - 1) * PAGE_SIZE + i + 1
+                    return RankResult(category=category, rank=rank, value=entry_value, page=page, username=entry_name)
+        return None
+
+    async def estimate_total(
+        self,
+        category: LeaderboardCategory,
+        max_requests: int = 500,
+        target_error: float = 0.0,
+        start_page: int = 1,
+        end_page: int | None = None,
+    ) -> LeaderboardEstimate:
+        counter = RequestCounter()
+        if end_page is None:
+            end_page = await self._page_count(category, 300, counter)
+
+        async def fetch(page: int) -> dict[str, Any]:
+            return await self._http.get(f"/v1/leaderboards/{category}/{page}", priority="bulk")
+
+        estimator = LeaderboardEstimator(fetch, max(max_requests - counter.count, 0), target_error)
+        estimate = await estimator.estimate(start_page, end_page)
+        return estimate.model_copy(update={"requests": estimate.requests + counter.count})
+
+    async def refresh(
+        self,
+        previous: LeaderboardSnapshot,
+        stride: int = 16,
+        buffer: int = 100,
+    ) -> tuple[LeaderboardSnapshot, LeaderboardDiff]:
+        if previous.category is None:
+            raise ValueError("Snapshot has no category to refresh")
+        category = cast(LeaderboardCategory, previous.category)
+        old_pages = previous.page_count()
+        pages = await self.page_count(category, ttl=0)
+        fetched: dict[int, list[tuple[str, str, float]]] = {}
+
+        async def fetch_all(wanted: Iterable[int]) -> None:
+            async for page, rows in stream_completed(wanted, lambda page: self._page_rows(category, page, "bulk"), buffer):
+                fetched[page] = rows
+
+        samples = sample_pages(min(old_pages, pages), stride)
+        await fetch_all(samples)
+        changed = {page for page in samples if fetched[page] != previous.rows_for_page(page)}
+        await fetch_all(sorted(dirty_pages(samples, changed) | set(range(min(old_pages, pages) + 1, pages + 1))))
+
+        builder = SnapshotBuilder(category)
+        for page in range(1, pages + 1):
+            builder.add_rows(page, fetched[page] if page in fetched else previous.rows_for_page(page))
+
+        touched = [page for page, rows in fetched.items() if rows != previous.rows_for_page(page)]
+        touched += range(pages + 1, old_pages + 1)
+        old = ranked((page, previous.rows_for_page(page)) for page in touched)
+        new = ranked((page, fetched.get(page, [])) for page in touched)
+        diff = LeaderboardDiff(category=category, changes=diff_rows(old, new), pages_fetched=len(fetched), pages_total=pages)
+        return builder.build(), diff
+
+    async def crawl(
+        self,
+        category: LeaderboardCategory,
+        checkpoint: str | Path | None = None,
+        buffer: int = 100,
+        max_failures: int = 20,
+    ) -> LeaderboardSnapshot:
+        builder = SnapshotBuilder(category)
+        store = CrawlCheckpoint(checkpoint) if checkpoint is not None else None
+        end: int | None = None
+        if store is not None:
+            done, end = store.load()
+            for page, cached in done.items():
+                builder.add(page, cached)
+        failed: list[int] = []
+        streak = 0
+        stopped = False
+
+        def pending() -> Iterator[int]:
+            page = 1
+            while (end is None or page < end) and not stopped:
+                if page not in builder:
+                    yield page
+                page += 1
+
+        async def fetch(page: int) -> dict[str, Any] | None:
+            try:
+                return await self._http.get(f"/v1/leaderboards/{category}/{page}", priority="bulk")
+            except NotFoundError:
+                return {"result": None}
+            except RETRYABLE_ERRORS:
+                failed.append(page)
+                return None
+
+        try:
+            async for page, data in stream_completed(pending(), fetch, buffer):
+                if data is None:
+                    streak += 1
+                    stopped = stopped or streak >= max_failures
+                    continue
+                streak = 0
+                if end is not None and page >= end:
+                    continue
+                if not data.get("result"):
+                    end = page
+                    if store is not None:
+                        store.record_end(page)
+                    continue
+                builder.add(page, data)
+                if store is not None:
+                    store.record_page(page, data)
+        finally:
+            if store is not None:
+                store.close()
+
+        missing = sorted(page for page in failed if end is None or page < end)
+        if stopped:
+            raise IncompleteCrawlError(f"Stopped after {max_failures} consecutive failed pages, rerun to resume", missing)
+        if missing:
+            raise IncompleteCrawlError(f"{len(missing)} pages failed, rerun to resume", missing)
+        if store is not None:
+            store.remove()
+        return builder.build()
 
     async def money(self, page: int = 1) -> LeaderboardResponse:
         return await self("money", page)
@@ -117,39 +767,87 @@ class LookupEndpoint:
     def __init__(self, http: HTTPClient):
         self._http = http
 
-    async def __call__(self, username: str) -> LookupResponse:
-        data = await self._http.get(f"/v1/lookup/{username}")
-        return LookupResponse.model_validate(data)
+    async def _fetch(self, name: str, priority: Priority = "interactive", decode: DecodeMode = "validated") -> LookupResponse | dict[str, Any]:
+        return await self._http.get_model(LookupResponse, f"/v1/lookup/{name}", priority=priority, decode=decode)
+
+    async def _fetch_or_missing(self, name: str, decode: DecodeMode) -> LookupResponse | dict[str, Any]:
+        try:
+            return await self._fetch(name, "bulk", decode)
+        except NotFoundError:
+            return missing(LookupResponse, decode)
 
-    async def batch(self, usernames: list[str]) -> list[LookupResponse]:
-        keys = self._http._rate_limiter.distribute(len(usernames))
+    @overload
+    async def __call__(self, username: str, decode: Literal["validated"] = "validated") -> LookupResponse: ...
 
-        async def fetch(username: str, key: str) -> LookupResponse:
-            data = await self._http.get_with_key(f"/v1/lookup/{username}", key)
-            return LookupResponse.model_validate(data)
+    @overload
+    async def __call__(self, username: str, *, decode: Literal["raw"]) -> dict[str, Any]: ...
 
-        return await run_batched(usernames, keys, fetch)
+    async def __call__(self, username: str, decode: DecodeMode = "validated") -> LookupResponse | dict[str, Any]:
+        return await self._fetch(normalize_username(username), decode=decode)
+
+    @overload
+    async def batch(self, usernames: list[str], decode: Literal["validated"] = "validated") -> list[LookupResponse]: ...
+
+    @overload
+    async def batch(self, usernames: list[str], *, decode: Literal["raw"]) -> list[dict[str, Any]]: ...
+
+    async def batch(self, usernames: list[str], decode: DecodeMode = "validated") -> list[Any]:
+        return await batch_players(usernames, lambda name: self._fetch_or_missing(name, decode))
+
+    @overload
+    def stream(
+        self, usernames: Iterable[str], buffer: int = 100, decode: Literal["validated"] = "validated"
+    ) -> AsyncIterator[tuple[str, LookupResponse]]: ...
+
+    @overload
+    def stream(self, usernames: Iterable[str], buffer: int = 100, *, decode: Literal["raw"]) -> AsyncIterator[tuple[str, dict[str, Any]]]: ...
+
+    def stream(
+        self, usernames: Iterable[str], buffer: int = 100, decode: DecodeMode = "validated"
+    ) -> AsyncIterator[tuple[str, LookupResponse | dict[str, Any]]]:
+        return stream_players(usernames, lambda name: self._fetch_or_missing(name, decode), buffer)
 
 
 class StatsEndpoint:
     def __init__(self, http: HTTPClient):
         self._http = http
 
-    def _parse(self, data: dict[str, Any], username: str) -> StatsResponse:
-        response = StatsResponse.model_validate(data)
-        if response.result:
-            response.result.username = username
-        return response
+    async def _fetch(self, name: str, priority: Priority = "interactive", decode: DecodeMode = "validated") -> StatsResponse | dict[str, Any]:
+        return await self._http.get_model(StatsResponse, f"/v1/stats/{name}", priority=priority, decode=decode)
+
+    async def _fetch_or_missing(self, name: str, decode: DecodeMode) -> StatsResponse | dict[str, Any]:
+        try:
+            return await self._fetch(name, "bulk", decode)
+        except NotFoundError:
+            return missing(StatsResponse, decode)
+
+    @overload
+    async def __call__(self, username: str, decode: Literal["validated"] = "validated") -> StatsResponse: ...
+
+    @overload
+    async def __call__(self, username: str, *, decode: Literal["raw"]) -> dict[str, Any]: ...
+
+    async def __call__(self, username: str, decode: DecodeMode = "validated") -> StatsResponse | dict[str, Any]:
+        return with_username(await self._fetch(normalize_username(username), decode=decode), username)
+
+    @overload
+    async def batch(self, usernames: list[str], decode: Literal["validated"] = "validated") -> list[StatsResponse]: ...
+
+    @overload
+    async def batch(self, usernames: list[str], *, decode: Literal["raw"]) -> list[dict[str, Any]]: ...
 
-    async def __call__(self, username: str) -> StatsResponse:
-        data = await self._http.get(f"/v1/stats/{username}")
-        return self._parse(data, username)
+    async def batch(self, usernames: list[str], decode: DecodeMode = "validated") -> list[Any]:
+        return await batch_players(usernames, lambda name: self._fetch_or_missing(name, decode), with_username)
 
-    async def batch(self, usernames: list[str]) -> list[StatsResponse]:
-        keys = self._http._rate_limiter.distribute(len(usernames))
+    @overload
+    def stream(
+        self, usernames: Iterable[str], buffer: int = 100, decode: Literal["validated"] = "validated"
+    ) -> AsyncIterator[tuple[str, StatsResponse]]: ...
 
-        async def fetch(username: str, key: str) -> StatsResponse:
-            data = await self._http.get_with_key(f"/v1/stats/{username}", key)
-            return self._parse(data, username)
+    @overload
+    def stream(self, usernames: Iterable[str], buffer: int = 100, *, decode: Literal["raw"]) -> AsyncIterator[tuple[str, dict[str, Any]]]: ...
 
-        return await run_batched(usernames, keys, fetch)
+    def stream(
+        self, usernames: Iterable[str], buffer: int = 100, decode: DecodeMode = "validated"
+    ) -> AsyncIterator[tuple[str, StatsResponse | dict[str, Any]]]:
+        return stream_players(usernames, lambda name: self._fetch_or_missing(name, decode), buffer, with_username)
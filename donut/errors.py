@@ -13,3 +13,15 @@ class NotFoundError(DonutAPIError):
 class ServerError(DonutAPIError):
     pass
 
+
+
+class RateLimitedError(DonutAPIError):
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class IncompleteCrawlError(DonutAPIError):
+    def __init__(self, message: str, missing_pages: list[int]):
+        super().__init__(message)
+        self.missing_pages = missing_pages
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from .helpers import format_number
+from .snapshot import PAGE_SIZE, page_rows
+
+GOLDEN_SPLIT = 0.382
+PAGE_THRESHOLDS = [(1000, 0.95), (5000, 0.94), (15000, 0.85), (float("inf"), 0.84)]
+ROC_ADJUSTMENTS = [(0.5, 0.03), (0.2, 0.01), (0.05, -0.01), (float("-inf"), -0.03)]
+
+
+class PageSummary(NamedTuple):
+    total: float
+    first: float
+    last: float
+
+    @classmethod
+    def from_page(cls, data: dict[str, Any]) -> PageSummary:
+        values = [value for _, _, value in page_rows(data)]
+        if not values:
+            return cls(0.0, 0.0, 0.0)
+        return cls(math.fsum(values), values[0], values[-1])
+
+
+class Interval(NamedTuple):
+    start: int
+    end: int
+    upper: float
+    lower: float
+
+    @property
+    def pages(self) -> int:
+        return self.end - self.start + 1
+
+
+class LeaderboardEstimate(BaseModel):
+    total: float
+    uncertainty: float
+    requests: int
+    pages: int
+
+    @property
+    def relative_uncertainty(self) -> float:
+        return self.uncertainty / self.total if self.total else 0.0
+
+    def __str__(self) -> str:
+        return f"{format_number(self.total)} ± {self.relative_uncertainty:.2%} ({self.requests} requests)"
+
+
+def find_threshold(page: int, start_value: float, end_value: float) -> float:
+    base = next(t for p, t in PAGE_THRESHOLDS if page < p)
+    roc = (start_value - end_value) / start_value if start_value else 0
+    adj = next(a for r, a in ROC_ADJUSTMENTS if roc > r)
+    return max(0.80, min(1, base + adj))
+
+
+def exponential_regression_estimate(start_value: float, end_value: float, num_pages: int) -> tuple[float, float]:
+    if start_value <= 0 or end_value <= 0:
+        return start_value * num_pages * PAGE_SIZE, 0.0
+    decay_rate = (math.log(start_value) - math.log(end_value)) / num_pages
+    if decay_rate <= 0:
+        return start_value * num_pages * PAGE_SIZE, 0.0
+    total = (start_value / decay_rate) * (1 - math.exp(-decay_rate * num_pages)) * PAGE_SIZE
+    uncertainty = (start_value - end_value) * 0.5 * num_pages * PAGE_SIZE
+    return total, uncertainty
+
+
+def _regression(interval: Interval) -> tuple[float, float]:
+    return exponential_regression_estimate(interval.upper, interval.lower, interval.pages)
+
+
+class LeaderboardEstimator:
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[dict[str, Any]]],
+        max_requests: int = 500,
+        target_error: float = 0.0,
+    ):
+        self._fetch = fetch
+        self.max_requests = max_requests
+        self.target_error = target_error
+        self.requests = 0
+        self._summaries: dict[int, PageSummary] = {}
+
+    async def _summarize(self, pages: list[int]) -> list[PageSummary]:
+        missing = [page for page in dict.fromkeys(pages) if page not in self._summaries]
+        self.requests += len(missing)
+        for page, data in zip(missing, await asyncio.gather(*[self._fetch(page) for page in missing]), strict=True):
+            self._summaries[page] = PageSummary.from_page(data)
+        return [self._summaries[page] for page in pages]
+
+    def _converged(self, interval: Interval) -> bool:
+        if interval.upper <= 0:
+            return True
+        return interval.lower / interval.upper > find_threshold(interval.start, interval.upper, interval.lower)
+
+    def _within_target(self, known: float, uncertainty: float, open_intervals: list[Interval]) -> bool:
+        if self.target_error <= 0:
+            return False
+        estimates = [_regression(interval) for interval in open_intervals]
+        total = known + sum(e[0] for e in estimates)
+        error = uncertainty + sum(e[1] for e in estimates)
+        return total > 0 and error <= self.target_error * total
+
+    async def estimate(self, start_page: int, end_page: int) -> LeaderboardEstimate:
+        if end_page < start_page:
+            return LeaderboardEstimate(total=0, uncertainty=0, requests=0, pages=0)
+        first, last = await self._summarize([start_page, end_page])
+        known = first.total + (last.total if end_page != start_page else 0)
+        uncertainty = 0.0
+        open_intervals = [Interval(start_page + 1, end_page - 1, first.last, last.first)] if end_page - start_page > 1 else []
+
+        while open_intervals:
+            if self._within_target(known, uncertainty, open_intervals):
+                break
+            budget = self.max_requests - self.requests
+            pending: list[Interval] = []
+            for interval in open_intervals:
+                if interval.pages > 1 and self._converged(interval):
+                    total, error = _regression(interval)
+                    known += total
+                    uncertainty += error
+                else:
+                    pending.append(interval)
+            if budget <= 0:
+                open_intervals = pending
+                break
+
+            pending.sort(key=lambda interval: _regression(interval)[1], reverse=True)
+            selected, open_intervals = pending[:budget], pending[budget:]
+            splits = [
+                interval.start if interval.pages == 1 else interval.start + int(interval.pages * GOLDEN_SPLIT)
+                for interval in selected
+            ]
+            for interval, page, summary in zip(selected, splits, await self._summarize(splits), strict=True):
+                known += summary.total
+                if page > interval.start:
+                    open_intervals.append(Interval(interval.start, page - 1, interval.upper, summary.first))
+                if page < interval.end:
+                    open_intervals.append(Interval(page + 1, interval.end, summary.last, interval.lower))
+
+        for interval in open_intervals:
+            total, error = _regression(interval)
+            if interval.pages == 1 or error == 0:
+                total = (interval.upper + interval.lower) / 2 * interval.pages * PAGE_SIZE
+                error = (interval.upper - interval.lower) / 2 * interval.pages * PAGE_SIZE
+            known += total
+            uncertainty += error
+
+        return LeaderboardEstimate(total=known, uncertainty=uncertainty, requests=self.requests, pages=end_page - start_page + 1)
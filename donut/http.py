@@ -1,26 +1,113 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import random
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal, TypeVar, overload
 
 import aiohttp
 import orjson
+from pydantic import BaseModel
 
-from .errors import DonutAPIError, NotFoundError, ServerError, UnauthorizedError
+from .cache import NegativeCache, ResponseCache
+from .errors import DonutAPIError, NotFoundError, RateLimitedError, ServerError, UnauthorizedError
+from .models.decode import DecodeMode
+from .models.decode import decode as decode_model
 from .ratelimit import RateLimiter
+from .scheduler import Priority, Scheduler
+
+R = TypeVar("R")
+M = TypeVar("M", bound=BaseModel)
+
+RETRYABLE_ERRORS = (RateLimitedError, ServerError, aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+def request_key(method: str, endpoint: str, params: dict[str, Any] | None, json: dict[str, Any] | None) -> tuple[str, str, bytes, bytes]:
+    return (
+        method,
+        endpoint,
+        orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params else b"",
+        orjson.dumps(json, option=orjson.OPT_SORT_KEYS) if json else b"",
+    )
+
+
+def _header_number(headers: Mapping[str, str], *names: str) -> float | None:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value.split(",")[0].split(";")[0])
+        except ValueError:
+            continue
+    return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> dict[str, Any]:
+    limit = _header_number(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+    remaining = _header_number(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+    reset = _header_number(headers, "X-RateLimit-Reset", "RateLimit-Reset", "X-RateLimit-Reset-After")
+    if reset is not None:
+        if reset > 1e12:
+            reset = reset / 1000 - time.time()
+        elif reset > 1e9:
+            reset -= time.time()
+    return {
+        "limit": int(limit) if limit is not None else None,
+        "remaining": int(remaining) if remaining is not None else None,
+        "reset": reset,
+    }
 
 
 class HTTPClient:
     BASE_URL = "https://api.donutsmp.net"
 
-    def __init__(self, api_keys: str | list[str], timeout: float = 30.0):
+    def __init__(
+        self,
+        api_keys: str | list[str],
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        requests_per_minute: int | dict[str, int] = 250,
+        max_in_flight: int = 100,
+        cache: ResponseCache | None = None,
+        negative_cache: NegativeCache | None = None,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
         keys = [api_keys] if isinstance(api_keys, str) else api_keys
         if not keys:
             raise ValueError("At least one API key is required")
-        self._rate_limiter = RateLimiter(keys)
+        self._rate_limiter = RateLimiter(keys, requests_per_minute)
+        self._scheduler = Scheduler(max_in_flight)
+        self._cache = cache
+        self._negative_cache = negative_cache if negative_cache is not None else NegativeCache()
         self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
         self._session: aiohttp.ClientSession | None = None
         self._session_lock = asyncio.Lock()
+        self._pending: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @property
+    def requests_per_second(self) -> float:
+        return self._rate_limiter.capacity / self._rate_limiter.window
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is not None and not self._session.closed:
@@ -28,7 +115,7 @@ class HTTPClient:
         async with self._session_lock:
             if self._session is None or self._session.closed:
                 connector = aiohttp.TCPConnector(
-                    limit=1000,
+                    limit=self._scheduler.max_in_flight,
                     ttl_dns_cache=300,
                     keepalive_timeout=30,
                 )
@@ -51,14 +138,51 @@ class HTTPClient:
         if response.status >= 500:
             raise ServerError(f"Server error: {response.status}")
         if response.status == 429:
-            print(f"Rate limited: {response.status}")
-            return {}
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            raise RateLimitedError("Rate limited", retry_after)
         if not response.ok:
             raise DonutAPIError(f"Request failed: {response.status}")
         result: dict[str, Any] = orjson.loads(await response.read())
         return result
 
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self._max_backoff, self._backoff * 2 ** attempt))
+
     async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        priority: Priority = "interactive",
+    ) -> dict[str, Any]:
+        async with self._scheduler.slot(priority):
+            return await self._request_with_retries(method, endpoint, json, params, priority)
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        priority: Priority = "interactive",
+    ) -> dict[str, Any]:
+        attempt = 0
+        while True:
+            api_key = await self._rate_limiter.acquire(priority)
+            try:
+                return await self._send(method, endpoint, api_key, json, params)
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self._max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                if isinstance(e, RateLimitedError):
+                    self._rate_limiter.cooldown(api_key, e.retry_after if e.retry_after is not None else delay)
+                else:
+                    await asyncio.sleep(delay)
+
+    async def _send(
         self,
         method: str,
         endpoint: str,
@@ -77,19 +201,93 @@ class HTTPClient:
             data=orjson.dumps(json) if json else None,
             headers=headers,
         ) as response:
+            self._rate_limiter.update(api_key, **parse_rate_limit_headers(response.headers))
             return await self._handle_response(response)
 
-    async def get(self, endpoint: str, json: dict[str, Any] | None = None, **params: Any) -> dict[str, Any]:
-        key = self._rate_limiter.next_key()
-        return await self._request("GET", endpoint, key, json, params or None)
+    def _release_pending(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if not future.cancelled():
+            future.exception()
+
+    async def _single_flight(self, key: Hashable, factory: Callable[[], Awaitable[R]]) -> R:
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._pending[key] = future
+            future.add_done_callback(lambda f: self._release_pending(key, f))
+        result: R = await asyncio.shield(future)
+        return result
+
+    async def get(
+        self, endpoint: str, json: dict[str, Any] | None = None, priority: Priority = "interactive", **params: Any
+    ) -> dict[str, Any]:
+        key = request_key("GET", endpoint, params, json)
+        negative = self._negative_cache.applies_to(endpoint)
+        if negative and endpoint in self._negative_cache:
+            raise NotFoundError("Resource not found")
+
+        cache = self._cache
+        ttl = cache.ttl_for(endpoint) if cache is not None else 0
+        cache_key = b" ".join(part if isinstance(part, bytes) else part.encode() for part in key).decode()
+        if cache is not None and ttl > 0 and (cached := cache.get(cache_key)) is not None:
+            return cached
+
+        async def fetch() -> dict[str, Any]:
+            try:
+                data = await self._request("GET", endpoint, json, params or None, priority)
+            except NotFoundError:
+                if negative:
+                    self._negative_cache.add(endpoint)
+                raise
+            if cache is not None:
+                cache.set(cache_key, data, ttl)
+            return data
+
+        return await self._single_flight(key, fetch)
+
+    @overload
+    async def get_model(
+        self,
+        model: type[M],
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        priority: Priority = "interactive",
+        decode: Literal["validated"] = "validated",
+        **params: Any,
+    ) -> M: ...
+
+    @overload
+    async def get_model(
+        self,
+        model: type[M],
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        priority: Priority = "interactive",
+        *,
+        decode: Literal["raw"],
+        **params: Any,
+    ) -> dict[str, Any]: ...
+
+    async def get_model(
+        self,
+        model: type[M],
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        priority: Priority = "interactive",
+        decode: DecodeMode = "validated",
+        **params: Any,
+    ) -> M | dict[str, Any]:
+        if decode == "raw":
+            return await self.get(endpoint, json, priority, **params)
+
+        async def fetch() -> M:
+            return decode_model(model, await self.get(endpoint, json, priority, **params))
 
-    async def get_with_key(self, endpoint: str, api_key: str, json: dict[str, Any] | None = None, **params: Any) -> dict[str, Any]:
-        self._rate_limiter.record(api_key)
-        return await self._request("GET", endpoint, api_key, json, params or None)
+        return await self._single_flight((model, *request_key("GET", endpoint, params, json)), fetch)
 
     async def put(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
-        key = self._rate_limiter.next_key()
-        return await self._request("PUT", endpoint, key, data)
+        return await self._request("PUT", endpoint, data)
 
     async def __aenter__(self) -> HTTPClient:
         await self._get_session()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from typing import Any, Generic, Literal, TypeVar
+from datetime import timedelta
+from functools import cached_property
+from typing import Any, Generic, Literal, NamedTuple, TypeVar
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from ..helpers import format_number
-from .helpers import clean_id, format_date, format_time
+from .helpers import clean_id, format_date, format_time, parse_number
+from .intern import FrozenDict, ItemKey, enchant_key, intern_id, intern_strings, ordered_levels, pool
 
 AuctionSort = Literal["lowest_price", "highest_price", "recently_listed", "last_listed"]
 
@@ -43,6 +46,8 @@ class SingleResponse(BaseModel, Generic[T]):
 
 
 class Seller(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     uuid: str | None = None
 
@@ -51,13 +56,22 @@ class Seller(BaseModel):
 
 
 class Trim(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     material: str | None = None
     pattern: str | None = None
 
 
 class Enchantments(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     levels: dict[str, int] | None = None
 
+    @field_validator("levels", mode="after")
+    @classmethod
+    def freeze_levels(cls, v: dict[str, int] | None) -> dict[str, int] | None:
+        return FrozenDict(v) if v is not None else None
+
     def __str__(self) -> str:
         if not self.levels:
             return ""
@@ -65,9 +79,38 @@ class Enchantments(BaseModel):
 
 
 class ItemData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     enchantments: Enchantments | None = None
     trim: Trim | None = None
 
+    @field_validator("enchantments", mode="after")
+    @classmethod
+    def intern_enchantments(cls, v: Enchantments | None) -> Enchantments | None:
+        return pool.get(("enchantments", ordered_levels(v.levels)), v) if v is not None else None
+
+    @field_validator("trim", mode="after")
+    @classmethod
+    def intern_trim(cls, v: Trim | None) -> Trim | None:
+        return pool.get(("trim", v.material, v.pattern), v) if v is not None else None
+
+    @property
+    def key(self) -> tuple[tuple[tuple[str, int], ...], str | None, str | None]:
+        levels = self.enchantments.levels if self.enchantments else None
+        return enchant_key(levels), self.trim.material if self.trim else None, self.trim.pattern if self.trim else None
+
+
+def intern_item_data(v: ItemData | None) -> ItemData | None:
+    if v is None:
+        return None
+    levels = ordered_levels(v.enchantments.levels) if v.enchantments else None
+    trim = (v.trim.material, v.trim.pattern) if v.trim else None
+    return pool.get(("item_data", levels, trim), v)
+
+
+def intern_seller(v: Seller | None) -> Seller | None:
+    return pool.get(("seller", v.name, v.uuid), v) if v is not None else None
+
 
 class ContainerItem(BaseModel):
     id: str | None = None
@@ -75,6 +118,16 @@ class ContainerItem(BaseModel):
     count: int | None = None
     enchants: ItemData | None = None
 
+    @field_validator("id", mode="after")
+    @classmethod
+    def intern_item_id(cls, v: str | None) -> str | None:
+        return intern_id(v)
+
+    @field_validator("enchants", mode="after")
+    @classmethod
+    def intern_enchants(cls, v: ItemData | None) -> ItemData | None:
+        return intern_item_data(v)
+
     def __str__(self) -> str:
         name = self.display_name or (clean_id(self.id) if self.id else "Unknown")
         return f"{name} x{self.count}" if self.count and self.count > 1 else name
@@ -88,6 +141,26 @@ class Item(BaseModel):
     enchants: ItemData | None = None
     contents: list[ContainerItem] | None = None
 
+    @field_validator("id", mode="after")
+    @classmethod
+    def intern_item_id(cls, v: str | None) -> str | None:
+        return intern_id(v)
+
+    @field_validator("lore", mode="after")
+    @classmethod
+    def intern_lore(cls, v: list[str] | None) -> list[str] | None:
+        return intern_strings(v) if v else v
+
+    @field_validator("enchants", mode="after")
+    @classmethod
+    def intern_enchants(cls, v: ItemData | None) -> ItemData | None:
+        return intern_item_data(v)
+
+    @cached_property
+    def fingerprint(self) -> ItemKey:
+        enchant_levels, trim_material, trim_pattern = self.enchants.key if self.enchants else ((), None, None)
+        return self.id, enchant_levels, trim_material, trim_pattern
+
     def __str__(self) -> str:
         name = self.display_name or (clean_id(self.id) if self.id else "Unknown")
         parts = [f"{name} x{self.count}" if self.count and self.count > 1 else name]
@@ -104,6 +177,11 @@ class AuctionEntry(BaseModel):
     seller: Seller | None = None
     time_left: int | None = None
 
+    @field_validator("seller", mode="after")
+    @classmethod
+    def intern_seller(cls, v: Seller | None) -> Seller | None:
+        return intern_seller(v)
+
     def __str__(self) -> str:
         item_str = str(self.item) if self.item else "Unknown Item"
         price_str = format_number(self.price) if self.price else "?"
@@ -127,6 +205,11 @@ class PurchaseItem(BaseModel):
     seller: Seller | None = None
     unixMillisDateSold: int | None = None
 
+    @field_validator("seller", mode="after")
+    @classmethod
+    def intern_seller(cls, v: Seller | None) -> Seller | None:
+        return intern_seller(v)
+
     def __str__(self) -> str:
         item_str = str(self.item) if self.item else "Unknown Item"
         price_str = format_number(self.price) if self.price else "?"
@@ -173,6 +256,46 @@ class LookupResponse(SingleResponse[LookupResult]):
     pass
 
 
+STAT_FIELDS = (
+    "money", "shards", "playtime", "kills", "deaths", "mobs_killed",
+    "broken_blocks", "placed_blocks", "money_made_from_sell", "money_spent_on_shop",
+)
+
+
+def _count(value: str | None) -> int | None:
+    number = parse_number(value)
+    return int(number) if number is not None else None
+
+
+class ParsedStats(NamedTuple):
+    money: float | None
+    shards: int | None
+    playtime: timedelta | None
+    kills: int | None
+    deaths: int | None
+    mobs_killed: int | None
+    broken_blocks: int | None
+    placed_blocks: int | None
+    money_made_from_sell: float | None
+    money_spent_on_shop: float | None
+
+    @classmethod
+    def parse(cls, stats: Stats) -> ParsedStats:
+        playtime = parse_number(stats.playtime)
+        return cls(
+            money=parse_number(stats.money),
+            shards=_count(stats.shards),
+            playtime=timedelta(milliseconds=playtime) if playtime is not None else None,
+            kills=_count(stats.kills),
+            deaths=_count(stats.deaths),
+            mobs_killed=_count(stats.mobs_killed),
+            broken_blocks=_count(stats.broken_blocks),
+            placed_blocks=_count(stats.placed_blocks),
+            money_made_from_sell=parse_number(stats.money_made_from_sell),
+            money_spent_on_shop=parse_number(stats.money_spent_on_shop),
+        )
+
+
 class Stats(BaseModel):
     username: str | None = None
     money: str | None = None
@@ -193,6 +316,10 @@ class Stats(BaseModel):
         "money_made_from_sell": "Sell Income", "money_spent_on_shop": "Shop Spent",
     }
 
+    @cached_property
+    def parsed(self) -> ParsedStats:
+        return ParsedStats.parse(self)
+
     def __str__(self) -> str:
         lines = [f"{self._LABELS[f]}: {v}" for f in self._LABELS if (v := getattr(self, f))]
         if not lines and not self.username:
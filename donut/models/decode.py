@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any, Literal, TypeVar, overload
+
+from pydantic import BaseModel
+
+DecodeMode = Literal["validated", "raw"]
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@overload
+def decode(model: type[M], data: dict[str, Any], mode: Literal["validated"] = "validated") -> M: ...
+
+
+@overload
+def decode(model: type[M], data: dict[str, Any], mode: Literal["raw"]) -> dict[str, Any]: ...
+
+
+def decode(model: type[M], data: dict[str, Any], mode: DecodeMode = "validated") -> M | dict[str, Any]:
+    if mode == "raw":
+        return data
+    return model.model_validate(data)
@@ -11,6 +11,15 @@ def format_time(ms: int) -> str:
     return " ".join(parts)
 
 
+def parse_number(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value.replace(",", ""))
+    except ValueError:
+        return None
+
+
 def clean_id(item_id: str) -> str:
     return item_id.replace("minecraft:", "").replace("_", " ").title()
 
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from collections.abc import Hashable, Mapping
+from typing import Any, NoReturn, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+ItemKey = tuple[Any, ...]
+
+
+class FrozenDict(dict[K, V]):
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self.items()))
+
+    def __reduce__(self) -> tuple[type[FrozenDict[K, V]], tuple[dict[K, V]]]:
+        return type(self), (dict(self),)
+
+
+class InternPool:
+    def __init__(self) -> None:
+        self.hits = 0
+        self._objects: weakref.WeakValueDictionary[Hashable, Any] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, key: Hashable, value: T) -> T:
+        existing: T | None = self._objects.get(key)
+        if existing is not None:
+            self.hits += 1
+            return existing
+        self._objects[key] = value
+        return value
+
+    def clear(self) -> None:
+        self._objects.clear()
+        self.hits = 0
+
+
+pool = InternPool()
+
+
+def intern_id(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
+def intern_strings(values: list[str]) -> list[str]:
+    return [sys.intern(value) for value in values]
+
+
+def ordered_levels(levels: Mapping[str, int] | None) -> tuple[tuple[str, int], ...]:
+    return tuple(levels.items()) if levels else ()
+
+
+def enchant_key(levels: Mapping[str, int] | None) -> tuple[tuple[str, int], ...]:
+    return tuple(sorted(levels.items())) if levels else ()
+
+
+def item_fingerprint(item: Any) -> ItemKey:
+    if item is None:
+        return None, (), None, None
+    if isinstance(item, dict):
+        data = item.get("enchants") or {}
+        trim = data.get("trim") or {}
+        levels = (data.get("enchantments") or {}).get("levels")
+        return item.get("id"), enchant_key(levels), trim.get("material"), trim.get("pattern")
+    fingerprint: ItemKey = item.fingerprint
+    return fingerprint
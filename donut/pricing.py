@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import time
+from bisect import bisect_left, insort
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from pydantic import BaseModel
+
+from .models import AuctionEntry, PurchaseItem
+from .models.intern import ItemKey, item_fingerprint
+from .watch import listing_key, sold_at, transaction_key
+
+
+def _unit_price(entry: AuctionEntry | PurchaseItem | dict[str, Any]) -> tuple[ItemKey, float, int] | None:
+    if isinstance(entry, dict):
+        item, price = entry.get("item"), entry.get("price")
+        count = (item or {}).get("count") or 1
+    else:
+        item, price = entry.item, entry.price
+        count = (item.count if item else None) or 1
+    if price is None:
+        return None
+    return item_fingerprint(item), price / count, count
+
+
+class ItemPrice(BaseModel):
+    item: ItemKey
+    min_ask: float | None = None
+    listings: int = 0
+    median_sale: float | None = None
+    sales: int = 0
+    volume: int = 0
+    turnover: float = 0.0
+
+    def __str__(self) -> str:
+        ask = f"{self.min_ask:,.0f}" if self.min_ask is not None else "-"
+        median = f"{self.median_sale:,.0f}" if self.median_sale is not None else "-"
+        return f"{self.item[0]}: ask {ask} ({self.listings}), median sale {median} ({self.sales})"
+
+
+class _Sales:
+    __slots__ = ("prices", "volume", "turnover")
+
+    def __init__(self) -> None:
+        self.prices: list[float] = []
+        self.volume = 0
+        self.turnover = 0.0
+
+
+class PriceIndex:
+    def __init__(self, window: float = 86_400, listing_ttl: float = 3600):
+        self.window = window
+        self.listing_ttl = listing_ttl
+        self._asks: dict[ItemKey, list[tuple[float, int]]] = {}
+        self._listings: dict[Hashable, tuple[ItemKey, float, float, int]] = {}
+        self._listing_order: list[tuple[float, int, Hashable]] = []
+        self._sales: dict[ItemKey, _Sales] = {}
+        self._sale_order: list[tuple[float, int, ItemKey, float, int]] = []
+        self._sequence = itertools.count()
+        self.now = -math.inf
+
+    def __len__(self) -> int:
+        return len(self._asks.keys() | self._sales.keys())
+
+    def items(self) -> list[ItemKey]:
+        return list(self._asks.keys() | self._sales.keys())
+
+    def add_listing(self, entry: AuctionEntry | dict[str, Any], now: float | None = None) -> None:
+        priced = _unit_price(entry)
+        if priced is None:
+            return
+        now = time.time() if now is None else now
+        key = listing_key(entry)
+        if key in self._listings:
+            fingerprint, price, _, sequence = self._listings[key]
+        else:
+            fingerprint, price, _ = priced
+            sequence = next(self._sequence)
+            insort(self._asks.setdefault(fingerprint, []), (price, sequence))
+            heapq.heappush(self._listing_order, (now, sequence, key))
+        self._listings[key] = (fingerprint, price, now, sequence)
+        self.evict(now)
+
+    def remove_listing(self, key: Hashable) -> bool:
+        listing = self._listings.pop(key, None)
+        if listing is None:
+            return False
+        fingerprint, price, _, sequence = listing
+        asks = self._asks[fingerprint]
+        del asks[bisect_left(asks, (price, sequence))]
+        if not asks:
+            del self._asks[fingerprint]
+        return True
+
+    def add_sale(self, purchase: PurchaseItem | dict[str, Any], now: float | None = None) -> None:
+        priced = _unit_price(purchase)
+        if priced is None:
+            return
+        fingerprint, price, count = priced
+        now = time.time() if now is None else now
+        at = sold_at(purchase) or now
+        sales = self._sales.setdefault(fingerprint, _Sales())
+        insort(sales.prices, price)
+        sales.volume += count
+        sales.turnover += price * count
+        heapq.heappush(self._sale_order, (at, next(self._sequence), fingerprint, price, count))
+        self.remove_listing(transaction_key(purchase)[:4])
+        self.evict(max(now, at))
+
+    def ingest(self, entries: Iterable[AuctionEntry | PurchaseItem | dict[str, Any]], now: float | None = None) -> None:
+        for entry in entries:
+            if isinstance(entry, PurchaseItem) or (isinstance(entry, dict) and "unixMillisDateSold" in entry):
+                self.add_sale(entry, now)
+            else:
+                self.add_listing(entry, now)
+
+    def evict(self, now: float | None = None) -> None:
+        self.now = now = max(self.now, time.time() if now is None else now)
+        order = self._listing_order
+        cutoff = now - self.listing_ttl
+        while order and order[0][0] < cutoff:
+            _, sequence, key = heapq.heappop(order)
+            listing = self._listings.get(key)
+            if listing is None or listing[3] != sequence:
+                continue
+            if listing[2] < cutoff:
+                self.remove_listing(key)
+            else:
+                heapq.heappush(order, (listing[2], sequence, key))
+
+        sale_order = self._sale_order
+        cutoff = now - self.window
+        while sale_order and sale_order[0][0] < cutoff:
+            _, _, fingerprint, price, count = heapq.heappop(sale_order)
+            sales = self._sales[fingerprint]
+            del sales.prices[bisect_left(sales.prices, price)]
+            sales.volume -= count
+            sales.turnover -= price * count
+            if not sales.prices:
+                del self._sales[fingerprint]
+
+    def min_ask(self, item: ItemKey) -> float | None:
+        asks = self._asks.get(item)
+        return asks[0][0] if asks else None
+
+    def asks(self, item: ItemKey, n: int = 10) -> list[float]:
+        return [price for price, _ in self._asks.get(item, [])[:n]]
+
+    def sale_percentile(self, item: ItemKey, q: float) -> float | None:
+        if not 0 <= q <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        sales = self._sales.get(item)
+        if sales is None:
+            return None
+        prices = sales.prices
+        position = (len(prices) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(prices) - 1)
+        return prices[lower] + (prices[upper] - prices[lower]) * (position - lower)
+
+    def median_sale(self, item: ItemKey) -> float | None:
+        return self.sale_percentile(item, 50)
+
+    def volume(self, item: ItemKey) -> int:
+        sales = self._sales.get(item)
+        return sales.volume if sales is not None else 0
+
+    def price(self, item: ItemKey) -> ItemPrice:
+        sales = self._sales.get(item)
+        return ItemPrice(
+            item=item,
+            min_ask=self.min_ask(item),
+            listings=len(self._asks.get(item, [])),
+            median_sale=self.median_sale(item),
+            sales=len(sales.prices) if sales is not None else 0,
+            volume=sales.volume if sales is not None else 0,
+            turnover=sales.turnover if sales is not None else 0.0,
+        )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import NamedTuple
+
+import orjson
+from pydantic import BaseModel
+
+
+class PageBounds(NamedTuple):
+    first: float
+    last: float
+    entries: int
+    updated_at: float
+
+
+class RankResult(BaseModel):
+    category: str
+    rank: int
+    value: float
+    page: int
+    username: str | None = None
+    exact: bool = True
+    requests: int = 0
+
+    def __str__(self) -> str:
+        name = self.username or f"{self.value:,.0f}"
+        return f"{name}: #{self.rank:,} in {self.category} (page {self.page})"
+
+
+class PageIndex:
+    def __init__(self, path: str | Path | None = None, ttl: float = 3600):
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self._pages: dict[str, dict[int, PageBounds]] = {}
+        self._counts: dict[str, tuple[int, float]] = {}
+        self.load()
+
+    def __len__(self) -> int:
+        return sum(len(pages) for pages in self._pages.values())
+
+    def record(self, category: str, page: int, first: float, last: float, entries: int) -> None:
+        self._pages.setdefault(category, {})[page] = PageBounds(first, last, entries, time.time())
+
+    def get(self, category: str, page: int) -> PageBounds | None:
+        bounds = self._pages.get(category, {}).get(page)
+        if bounds is None or bounds.updated_at + self.ttl < time.time():
+            return None
+        return bounds
+
+    def record_page_count(self, category: str, count: int) -> None:
+        self._counts[category] = (count, time.time())
+
+    def page_count(self, category: str, max_age: float | None = None) -> int | None:
+        entry = self._counts.get(category)
+        if entry is None or (max_age is not None and entry[1] + max_age < time.time()):
+            return None
+        return entry[0]
+
+    def fresh(self, category: str) -> list[tuple[int, PageBounds]]:
+        cutoff = time.time() - self.ttl
+        return sorted((page, b) for page, b in self._pages.get(category, {}).items() if b.updated_at >= cutoff)
+
+    def bracket(self, category: str, value: float, page_count: int) -> tuple[int, int]:
+        pages = self.fresh(category)
+        low, high = 0, page_count + 1
+        lasts = [bounds.last for _, bounds in pages]
+        split = bisect_left([-last for last in lasts], -value)
+        if split > 0:
+            low = pages[split - 1][0]
+        if split < len(pages):
+            high = min(high, pages[split][0])
+        return low, high
+
+    def load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        raw = orjson.loads(self.path.read_bytes())
+        self._pages = {
+            category: {int(page): PageBounds(*bounds) for page, bounds in pages.items()}
+            for category, pages in raw.get("pages", {}).items()
+        }
+        self._counts = {category: (count, updated_at) for category, (count, updated_at) in raw.get("counts", {}).items()}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "pages": {category: {str(page): list(b) for page, b in pages.items()} for category, pages in self._pages.items()},
+            "counts": self._counts,
+        }
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_bytes(orjson.dumps(data))
+        os.replace(tmp, self.path)
+
+    def clear(self, category: str | None = None) -> None:
+        if category is None:
+            self._pages.clear()
+            self._counts.clear()
+        else:
+            self._pages.pop(category, None)
+            self._counts.pop(category, None)
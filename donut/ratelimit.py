@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from collections import deque
+from contextlib import suppress
+
+from .scheduler import LANES, Priority
 
 
 class RateLimiter:
-    def __init__(self, api_keys: list[str], requests_per_minute: int = 250):
+    def __init__(self, api_keys: list[str], requests_per_minute: int | dict[str, int] = 250, window: float = 65.0):
         self._keys = api_keys
-        self._limit = requests_per_minute
+        if isinstance(requests_per_minute, int):
+            self._limits = {k: requests_per_minute for k in api_keys}
+        else:
+            self._limits = {k: requests_per_minute.get(k, 250) for k in api_keys}
+        self._window = window
         self._index = 0
         self._timestamps: dict[str, deque[float]] = {k: deque() for k in api_keys}
+        self._cooldowns: dict[str, float] = {}
+        self._budgets: dict[str, tuple[int, float]] = {}
+        self._waiters: dict[Priority, deque[asyncio.Future[str]]] = {lane: deque() for lane in LANES}
+        self._drainer: asyncio.Task[None] | None = None
 
     @property
     def keys(self) -> list[str]:
@@ -17,55 +29,119 @@ class RateLimiter:
 
     @property
     def capacity(self) -> int:
-        return len(self._keys) * self._limit
+        return sum(self._limits.values())
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    def limit(self, key: str) -> int:
+        return self._limits[key]
 
     def _prune(self, key: str, now: float) -> None:
         ts = self._timestamps[key]
-        cutoff = now - 65
+        cutoff = now - self._window
         while ts and ts[0] < cutoff:
             ts.popleft()
 
     def _available(self, key: str, now: float) -> int:
+        if self._cooldowns.get(key, 0.0) > now:
+            return 0
         self._prune(key, now)
-        return self._limit - len(self._timestamps[key])
+        available = self._limits[key] - len(self._timestamps[key])
+        budget = self._budgets.get(key)
+        if budget is not None:
+            remaining, reset_at = budget
+            if now < reset_at:
+                return min(available, remaining)
+            del self._budgets[key]
+        return available
+
+    def _ready_at(self, key: str, now: float) -> float:
+        ts = self._timestamps[key]
+        ready = ts[0] + self._window if ts and len(ts) >= self._limits[key] else now
+        budget = self._budgets.get(key)
+        if budget is not None and budget[0] <= 0:
+            ready = max(ready, budget[1])
+        return max(ready, self._cooldowns.get(key, 0.0))
+
+    def _consume(self, key: str, now: float) -> None:
+        self._timestamps[key].append(now)
+        budget = self._budgets.get(key)
+        if budget is not None:
+            self._budgets[key] = (budget[0] - 1, budget[1])
 
     def record(self, key: str) -> None:
         now = time.monotonic()
         self._prune(key, now)
-        self._timestamps[key].append(now)
+        self._consume(key, now)
+
+    def cooldown(self, key: str, seconds: float) -> None:
+        until = time.monotonic() + seconds
+        self._cooldowns[key] = max(self._cooldowns.get(key, 0.0), until)
 
-    def next_key(self) -> str:
-        key = self._keys[self._index]
-        self._index = (self._index + 1) % len(self._keys)
-        return key
+    def update(self, key: str, limit: int | None = None, remaining: int | None = None, reset: float | None = None) -> None:
+        if limit is not None and limit > 0:
+            self._limits[key] = limit
+        if remaining is not None and reset is not None:
+            self._budgets[key] = (max(0, remaining), time.monotonic() + max(0.0, reset))
+
+    def try_acquire(self) -> str | None:
+        now = time.monotonic()
+        for _ in range(len(self._keys)):
+            key = self._keys[self._index]
+            self._index = (self._index + 1) % len(self._keys)
+            if self._available(key, now) > 0:
+                self._consume(key, now)
+                return key
+        return None
 
-    def distribute(self, count: int) -> list[list[str]]:
+    def wait_time(self) -> float:
         now = time.monotonic()
-        available = {k: self._available(k, now) for k in self._keys}
-        total_available = sum(available.values())
-        
-        batch: list[str] = []
-        remaining = count
-        key_idx = 0
-        num_keys = len(self._keys)
-        
-        while remaining > 0 and total_available > 0:
-            key = self._keys[key_idx]
-            if available[key] > 0:
-                batch.append(key)
-                self._timestamps[key].append(now)
-                available[key] -= 1
-                total_available -= 1
-                remaining -= 1
-            key_idx = (key_idx + 1) % num_keys
-        
-        if remaining > 0:
-            overflow: list[str] = []
-            while remaining > 0:
-                key = self._keys[key_idx]
-                overflow.append(key)
-                remaining -= 1
-                key_idx = (key_idx + 1) % num_keys
-            return [batch, overflow] if batch else [overflow]
-        
-        return [batch] if batch else []
+        waits = []
+        for key in self._keys:
+            if self._available(key, now) > 0:
+                return 0.0
+            waits.append(self._ready_at(key, now) - now)
+        return max(0.0, min(waits))
+
+    def queued(self, priority: Priority | None = None) -> int:
+        lanes = LANES if priority is None else (priority,)
+        return sum(len(self._waiters[lane]) for lane in lanes)
+
+    def _grant(self) -> None:
+        for lane in LANES:
+            waiters = self._waiters[lane]
+            while waiters:
+                if waiters[0].done():
+                    waiters.popleft()
+                    continue
+                key = self.try_acquire()
+                if key is None:
+                    return
+                waiters.popleft().set_result(key)
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                self._grant()
+                if not self.queued():
+                    return
+                await asyncio.sleep(self.wait_time())
+        finally:
+            self._drainer = None
+
+    async def acquire(self, priority: Priority = "interactive") -> str:
+        ahead = LANES[:LANES.index(priority) + 1]
+        if not any(self._waiters[lane] for lane in ahead) and (key := self.try_acquire()) is not None:
+            return key
+        fut: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(fut)
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.ensure_future(self._drain())
+        try:
+            return await fut
+        except asyncio.CancelledError:
+            with suppress(ValueError):
+                self._waiters[priority].remove(fut)
+            raise
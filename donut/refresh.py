@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from pydantic import BaseModel
+
+from .snapshot import PAGE_SIZE, Row
+
+
+class PlayerChange(BaseModel):
+    username: str
+    old_rank: int | None = None
+    new_rank: int | None = None
+    old_value: float | None = None
+    new_value: float | None = None
+
+    @property
+    def moved(self) -> bool:
+        return self.old_rank is not None and self.new_rank is not None and self.old_rank != self.new_rank
+
+    @property
+    def value_changed(self) -> bool:
+        return self.old_value is not None and self.new_value is not None and self.old_value != self.new_value
+
+    def __str__(self) -> str:
+        old = f"#{self.old_rank:,}" if self.old_rank is not None else "new"
+        new = f"#{self.new_rank:,}" if self.new_rank is not None else "gone"
+        return f"{self.username}: {old} -> {new}"
+
+
+class LeaderboardDiff(BaseModel):
+    category: str | None = None
+    changes: list[PlayerChange] = []
+    pages_fetched: int = 0
+    pages_total: int = 0
+
+    @property
+    def added(self) -> list[PlayerChange]:
+        return [change for change in self.changes if change.old_rank is None]
+
+    @property
+    def removed(self) -> list[PlayerChange]:
+        return [change for change in self.changes if change.new_rank is None]
+
+    @property
+    def moved(self) -> list[PlayerChange]:
+        return [change for change in self.changes if change.moved]
+
+    @property
+    def value_changed(self) -> list[PlayerChange]:
+        return [change for change in self.changes if change.value_changed]
+
+    def __str__(self) -> str:
+        return (
+            f"{self.category or 'leaderboard'}: {len(self.changes)} changes "
+            f"({self.pages_fetched}/{self.pages_total} pages fetched)"
+        )
+
+
+def ranked(pages: Iterable[tuple[int, list[Row]]], page_size: int = PAGE_SIZE) -> dict[str, tuple[int, float]]:
+    return {
+        username.lower(): ((page - 1) * page_size + i + 1, value)
+        for page, rows in pages
+        for i, (username, _, value) in enumerate(rows)
+        if username
+    }
+
+
+def diff_rows(old: dict[str, tuple[int, float]], new: dict[str, tuple[int, float]]) -> list[PlayerChange]:
+    changes = []
+    for name in old.keys() | new.keys():
+        before, after = old.get(name), new.get(name)
+        if before == after:
+            continue
+        changes.append(PlayerChange(
+            username=name,
+            old_rank=before[0] if before else None,
+            new_rank=after[0] if after else None,
+            old_value=before[1] if before else None,
+            new_value=after[1] if after else None,
+        ))
+    changes.sort(key=lambda change: change.new_rank or change.old_rank or 0)
+    return changes
+
+
+def sample_pages(pages: int, stride: int) -> list[int]:
+    if pages < 1:
+        return []
+    return sorted({*range(1, pages + 1, max(stride, 1)), pages})
+
+
+def dirty_pages(samples: list[int], changed: set[int]) -> set[int]:
+    dirty: set[int] = set()
+    for low, high in zip(samples, samples[1:], strict=False):
+        if low in changed or high in changed:
+            dirty.update(range(low + 1, high))
+    return dirty
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Literal
+
+Priority = Literal["interactive", "bulk"]
+
+LANES: tuple[Priority, ...] = ("interactive", "bulk")
+
+
+class Scheduler:
+    def __init__(self, max_in_flight: int = 100, reserved: int | None = None):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._max = max_in_flight
+        self._reserved = min(max_in_flight - 1, max(1, max_in_flight // 10) if reserved is None else reserved)
+        self._running: dict[Priority, int] = {lane: 0 for lane in LANES}
+        self._waiters: dict[Priority, deque[asyncio.Future[None]]] = {lane: deque() for lane in LANES}
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max
+
+    @property
+    def in_flight(self) -> int:
+        return sum(self._running.values())
+
+    def queued(self, priority: Priority | None = None) -> int:
+        lanes = LANES if priority is None else (priority,)
+        return sum(len(self._waiters[lane]) for lane in lanes)
+
+    def _can_admit(self, priority: Priority) -> bool:
+        if self.in_flight >= self._max:
+            return False
+        return priority == "interactive" or self._running["bulk"] < self._max - self._reserved
+
+    def _dispatch(self) -> None:
+        for lane in LANES:
+            waiters = self._waiters[lane]
+            while waiters and self._can_admit(lane):
+                fut = waiters.popleft()
+                if fut.done():
+                    continue
+                self._running[lane] += 1
+                fut.set_result(None)
+
+    async def acquire(self, priority: Priority = "interactive") -> None:
+        ahead = LANES[:LANES.index(priority) + 1]
+        if self._can_admit(priority) and not any(self._waiters[lane] for lane in ahead):
+            self._running[priority] += 1
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release(priority)
+            else:
+                with suppress(ValueError):
+                    self._waiters[priority].remove(fut)
+            raise
+
+    def release(self, priority: Priority = "interactive") -> None:
+        self._running[priority] -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = "interactive") -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
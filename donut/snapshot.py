@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import heapq
+import math
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterable, Iterable, Iterator, Mapping
+from itertools import accumulate
+from typing import Any
+
+from .models import LeaderboardEntry, LeaderboardResponse
+
+PAGE_SIZE = 45
+
+PageData = LeaderboardResponse | dict[str, Any]
+Row = tuple[str, str, float]
+
+
+def page_rows(page: PageData) -> Iterator[Row]:
+    if isinstance(page, dict):
+        for row in page.get("result") or []:
+            value = row.get("value")
+            yield row.get("username") or "", row.get("uuid") or "", float(value) if value else 0.0
+    else:
+        for entry in page:
+            yield entry.username or "", entry.uuid or "", entry.value
+
+
+class StringTable:
+    def __init__(self, strings: Iterable[str] = ()):
+        items = list(strings)
+        self._data = "".join(items)
+        self._offsets = array("Q", accumulate((len(s) for s in items), initial=0))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string table index out of range")
+        return self._data[self._offsets[index]:self._offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[str]:
+        data, offsets = self._data, self._offsets
+        for i in range(len(self)):
+            yield data[offsets[i]:offsets[i + 1]]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data.encode()) + self._offsets.itemsize * len(self._offsets)
+
+
+class LeaderboardSnapshot:
+    def __init__(
+        self,
+        values: array[float],
+        ranks: array[int],
+        usernames: StringTable,
+        uuids: StringTable,
+        category: str | None = None,
+        captured_at: float | None = None,
+    ):
+        self.values = values
+        self.ranks = ranks
+        self.usernames = usernames
+        self.uuids = uuids
+        self.category = category
+        self.captured_at = time.time() if captured_at is None else captured_at
+        self._sorted: array[float] | None = None
+        self._index: dict[str, int] | None = None
+
+    @classmethod
+    def from_pages(
+        cls,
+        pages: Mapping[int, PageData] | Iterable[PageData],
+        start_page: int = 1,
+        category: str | None = None,
+    ) -> LeaderboardSnapshot:
+        builder = SnapshotBuilder(category)
+        items = pages.items() if isinstance(pages, Mapping) else enumerate(pages, start_page)
+        for page, data in items:
+            builder.add(page, data)
+        return builder.build()
+
+    @classmethod
+    async def from_stream(
+        cls, pages: AsyncIterable[tuple[int, PageData]], category: str | None = None
+    ) -> LeaderboardSnapshot:
+        builder = SnapshotBuilder(category)
+        async for page, data in pages:
+            builder.add(page, data)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> LeaderboardEntry:
+        return LeaderboardEntry(username=self.usernames[index] or None, uuid=self.uuids[index] or None, value=self.values[index])
+
+    def __iter__(self) -> Iterator[LeaderboardEntry]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __str__(self) -> str:
+        return f"{self.category or 'leaderboard'}: {len(self)} entries, total {self.sum():,.0f}"
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.values.itemsize * len(self.values)
+            + self.ranks.itemsize * len(self.ranks)
+            + self.usernames.nbytes
+            + self.uuids.nbytes
+        )
+
+    def sum(self) -> float:
+        return math.fsum(self.values)
+
+    def mean(self) -> float:
+        return self.sum() / len(self) if len(self) else 0.0
+
+    def sorted_values(self) -> array[float]:
+        if self._sorted is None:
+            self._sorted = array("d", sorted(self.values))
+        return self._sorted
+
+    def percentile(self, q: float) -> float:
+        if not 0 <= q <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        values = self.sorted_values()
+        if not values:
+            raise ValueError("percentile of an empty snapshot")
+        position = (len(values) - 1) * q / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def top_n(self, n: int) -> list[LeaderboardEntry]:
+        return [self[i] for i in heapq.nlargest(n, range(len(self)), key=self.values.__getitem__)]
+
+    def count_above(self, value: float) -> int:
+        values = self.sorted_values()
+        return len(values) - bisect_right(values, value)
+
+    def count_at_least(self, value: float) -> int:
+        values = self.sorted_values()
+        return len(values) - bisect_left(values, value)
+
+    def rank_for_value(self, value: float) -> int:
+        return self.count_above(value) + 1
+
+    def index_of(self, username: str) -> int | None:
+        if self._index is None:
+            self._index = {name.lower(): i for i, name in enumerate(self.usernames) if name}
+        return self._index.get(username.lower())
+
+    def rank_of(self, username: str) -> int | None:
+        index = self.index_of(username)
+        return self.ranks[index] if index is not None else None
+
+    def value_of(self, username: str) -> float | None:
+        index = self.index_of(username)
+        return self.values[index] if index is not None else None
+
+    def page_count(self, page_size: int = PAGE_SIZE) -> int:
+        return math.ceil(self.ranks[-1] / page_size) if len(self) else 0
+
+    def rows_for_page(self, page: int, page_size: int = PAGE_SIZE) -> list[Row]:
+        start = bisect_left(self.ranks, (page - 1) * page_size + 1)
+        end = bisect_left(self.ranks, page * page_size + 1)
+        return [(self.usernames[i], self.uuids[i], self.values[i]) for i in range(start, end)]
+
+
+class SnapshotBuilder:
+    def __init__(self, category: str | None = None, page_size: int = PAGE_SIZE):
+        self.category = category
+        self.page_size = page_size
+        self._pages: dict[int, tuple[array[float], str, str]] = {}
+        self._started = time.time()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __contains__(self, page: int) -> bool:
+        return page in self._pages
+
+    @property
+    def pages(self) -> list[int]:
+        return sorted(self._pages)
+
+    def add(self, page: int, data: PageData) -> int:
+        return self.add_rows(page, list(page_rows(data)))
+
+    def add_rows(self, page: int, rows: list[Row]) -> int:
+        self._pages[page] = (
+            array("d", (value for _, _, value in rows)),
+            "\0".join(username for username, _, _ in rows),
+            "\0".join(uuid for _, uuid, _ in rows),
+        )
+        return len(rows)
+
+    def build(self) -> LeaderboardSnapshot:
+        values: array[float] = array("d")
+        ranks: array[int] = array("I")
+        usernames: list[str] = []
+        uuids: list[str] = []
+        for page in sorted(self._pages):
+            page_values, page_usernames, page_uuids = self._pages[page]
+            if not page_values:
+                continue
+            first_rank = (page - 1) * self.page_size + 1
+            values.extend(page_values)
+            ranks.extend(range(first_rank, first_rank + len(page_values)))
+            usernames.extend(page_usernames.split("\0"))
+            uuids.extend(page_uuids.split("\0"))
+        return LeaderboardSnapshot(values, ranks, StringTable(usernames), StringTable(uuids), self.category, self._started)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .models import STAT_FIELDS, StatsResponse
+from .models.helpers import parse_number
+
+NAN = float("nan")
+SCALE = {"playtime": 1 / 1000}
+
+
+class StatsTable:
+    def __init__(self, usernames: list[str | None], columns: dict[str, array[float]]):
+        self.usernames = usernames
+        self.columns = columns
+
+    @classmethod
+    def from_responses(cls, responses: Iterable[StatsResponse | dict[str, Any]]) -> StatsTable:
+        usernames: list[str | None] = []
+        columns = {field: array("d") for field in STAT_FIELDS}
+        appends = [(columns[field].append, SCALE.get(field, 1.0)) for field in STAT_FIELDS]
+        for response in responses:
+            result = response.get("result") if isinstance(response, dict) else response.result
+            if isinstance(result, dict):
+                usernames.append(result.get("username"))
+                values = [result.get(field) for field in STAT_FIELDS]
+            elif result is not None:
+                usernames.append(result.username)
+                values = [getattr(result, field) for field in STAT_FIELDS]
+            else:
+                usernames.append(None)
+                values = [None] * len(STAT_FIELDS)
+            for (append, scale), raw in zip(appends, values, strict=True):
+                value = parse_number(raw)
+                append(NAN if value is None else value * scale)
+        return cls(usernames, columns)
+
+    def __len__(self) -> int:
+        return len(self.usernames)
+
+    def __getitem__(self, field: str) -> array[float]:
+        return self.columns[field]
+
+    def sum(self, field: str) -> float:
+        return math.fsum(value for value in self.columns[field] if not math.isnan(value))
+
+    def top(self, field: str, n: int = 10) -> list[tuple[str | None, float]]:
+        column = self.columns[field]
+        present = (i for i in range(len(column)) if not math.isnan(column[i]))
+        return [(self.usernames[i], column[i]) for i in heapq.nlargest(n, present, key=column.__getitem__)]
+
+    def rank(self, field: str) -> list[int]:
+        column = self.columns[field]
+        return sorted((i for i in range(len(column)) if not math.isnan(column[i])), key=column.__getitem__, reverse=True)
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        for i, username in enumerate(self.usernames):
+            row: dict[str, Any] = {"username": username}
+            for field in STAT_FIELDS:
+                value = self.columns[field][i]
+                row[field] = None if math.isnan(value) else value
+            yield row
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import mmap
+import struct
+import time
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+import orjson
+
+from .models import PurchaseItem
+from .models.intern import ItemKey, item_fingerprint
+
+MAGIC = b"DTXL\x01"
+BLOCK = struct.Struct("<4sIIIqq")
+BLOCK_MAGIC = b"BLK1"
+
+INT_COLUMNS = ("sold_at", "count", "item", "enchants", "seller_uuid", "seller_name")
+
+
+class TransactionRecord(NamedTuple):
+    sold_at: int
+    price: float
+    quantity: int
+    item_id: str
+    enchantments: tuple[tuple[str, int], ...]
+    trim_material: str | None
+    trim_pattern: str | None
+    seller_uuid: str
+    seller_name: str
+
+    @property
+    def fingerprint(self) -> ItemKey:
+        return self.item_id or None, self.enchantments, self.trim_material, self.trim_pattern
+
+    @property
+    def unit_price(self) -> float:
+        return self.price / (self.quantity or 1)
+
+
+class BlockInfo(NamedTuple):
+    offset: int
+    length: int
+    rows: int
+    start: int
+    end: int
+
+
+class BlockColumns(NamedTuple):
+    prices: array[float]
+    columns: dict[str, array[int]]
+    items: list[str]
+    enchants: list[str]
+    seller_uuids: list[str]
+    seller_names: list[str]
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.ids)
+        return index
+
+
+def _encode_strings(strings: Iterable[str]) -> bytes:
+    encoded = [s.encode() for s in strings]
+    lengths = array("I", (len(s) for s in encoded))
+    return struct.pack("<I", len(encoded)) + lengths.tobytes() + b"".join(encoded)
+
+
+def _decode_strings(data: memoryview, offset: int) -> tuple[list[str], int]:
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    lengths = array("I")
+    lengths.frombytes(data[offset:offset + 4 * count])
+    offset += 4 * count
+    strings = []
+    for length in lengths:
+        strings.append(bytes(data[offset:offset + length]).decode())
+        offset += length
+    return strings, offset
+
+
+def _scan_blocks(data: bytes | mmap.mmap) -> list[BlockInfo]:
+    blocks = []
+    offset = len(MAGIC)
+    while offset + BLOCK.size <= len(data):
+        magic, length, crc, rows, start, end = BLOCK.unpack_from(data, offset)
+        body = offset + BLOCK.size
+        if magic != BLOCK_MAGIC or body + length > len(data) or zlib.crc32(data[body:body + length]) != crc:
+            break
+        blocks.append(BlockInfo(body, length, rows, start, end))
+        offset = body + length
+    return blocks
+
+
+def _enchant_key(item: ItemKey) -> str:
+    _, levels, material, pattern = item
+    return orjson.dumps([levels, material, pattern]).decode() if levels or material or pattern else ""
+
+
+def enchant_value(key: str) -> tuple[tuple[tuple[str, int], ...], str | None, str | None]:
+    if not key:
+        return (), None, None
+    levels, material, pattern = orjson.loads(key)
+    return tuple((name, level) for name, level in levels), material, pattern
+
+
+class TransactionLog:
+    def __init__(self, path: str | Path, block_rows: int = 4096, flush_interval: float = 60.0, level: int = 6):
+        self.path = Path(path)
+        self.block_rows = block_rows
+        self.flush_interval = flush_interval
+        self.level = level
+        self._file: IO[bytes] | None = None
+        self._rows: list[tuple[int, float, int, str, str, str, str]] = []
+        self._flushed = time.monotonic()
+
+    def _open(self) -> IO[bytes]:
+        if self._file is None:
+            self._recover()
+            self._file = self.path.open("ab")
+            if self._file.tell() == 0:
+                self._file.write(MAGIC)
+        return self._file
+
+    def _recover(self) -> None:
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if not size:
+            return
+        with self.path.open("r+b") as f:
+            if size < len(MAGIC):
+                if not MAGIC.startswith(f.read()):
+                    raise ValueError(f"{self.path} is not a transaction log")
+                f.truncate(0)
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:len(MAGIC)] != MAGIC:
+                    raise ValueError(f"{self.path} is not a transaction log")
+                blocks = _scan_blocks(data)
+            valid = blocks[-1].offset + blocks[-1].length if blocks else len(MAGIC)
+            if valid < size:
+                f.truncate(valid)
+
+    def append(self, purchase: PurchaseItem | dict[str, Any]) -> None:
+        if isinstance(purchase, dict):
+            purchase = PurchaseItem.model_validate(purchase)
+        item, seller = purchase.item, purchase.seller
+        fingerprint = item_fingerprint(item)
+        self._rows.append((
+            purchase.unixMillisDateSold or int(time.time() * 1000),
+            purchase.price or 0.0,
+            (item.count if item else None) or 1,
+            fingerprint[0] or "",
+            _enchant_key(fingerprint),
+            (seller.uuid if seller else None) or "",
+            (seller.name if seller else None) or "",
+        ))
+        if len(self._rows) >= self.block_rows or time.monotonic() - self._flushed >= self.flush_interval:
+            self.flush()
+
+    def extend(self, purchases: Iterable[PurchaseItem | dict[str, Any]]) -> None:
+        for purchase in purchases:
+            self.append(purchase)
+
+    def flush(self) -> None:
+        self._flushed = time.monotonic()
+        if not self._rows:
+            return
+        rows, self._rows = sorted(self._rows, key=lambda row: row[0]), []
+        interners = {name: _Interner() for name in ("item", "enchants", "seller_uuid", "seller_name")}
+        columns = {name: array("q" if name == "sold_at" else "I") for name in INT_COLUMNS}
+        prices = array("d")
+        for sold_at, price, count, item_id, enchants, seller_uuid, seller_name in rows:
+            columns["sold_at"].append(sold_at)
+            prices.append(price)
+            columns["count"].append(count)
+            columns["item"].append(interners["item"](item_id))
+            columns["enchants"].append(interners["enchants"](enchants))
+            columns["seller_uuid"].append(interners["seller_uuid"](seller_uuid))
+            columns["seller_name"].append(interners["seller_name"](seller_name))
+
+        payload = b"".join([
+            prices.tobytes(),
+            *(columns[name].tobytes() for name in INT_COLUMNS),
+            *(_encode_strings(interner.ids) for interner in interners.values()),
+        ])
+        compressed = zlib.compress(payload, self.level)
+        f = self._open()
+        f.write(BLOCK.pack(BLOCK_MAGIC, len(compressed), zlib.crc32(compressed), len(rows), rows[0][0], rows[-1][0]) + compressed)
+        f.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> TransactionLog:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class TransactionLogReader:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = self.path.open("rb")
+        size = self.path.stat().st_size
+        self._map: mmap.mmap | None = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.blocks = self._scan()
+
+    def _scan(self) -> list[BlockInfo]:
+        data = self._map
+        if data is None:
+            return []
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a transaction log")
+        return _scan_blocks(data)
+
+    def __len__(self) -> int:
+        return sum(block.rows for block in self.blocks)
+
+    def read_block(self, block: BlockInfo) -> BlockColumns:
+        if self._map is None:
+            raise ValueError("Transaction log is closed")
+        payload = memoryview(zlib.decompress(self._map[block.offset:block.offset + block.length]))
+        rows = block.rows
+        prices = array("d")
+        prices.frombytes(payload[:8 * rows])
+        offset = 8 * rows
+        columns: dict[str, array[int]] = {}
+        for name in INT_COLUMNS:
+            column = columns[name] = array("q" if name == "sold_at" else "I")
+            size = column.itemsize * rows
+            column.frombytes(payload[offset:offset + size])
+            offset += size
+        tables = []
+        for _ in range(4):
+            strings, offset = _decode_strings(payload, offset)
+            tables.append(strings)
+        return BlockColumns(prices, columns, *tables)
+
+    def blocks_between(self, start: int | None = None, end: int | None = None) -> list[BlockInfo]:
+        return [
+            block for block in self.blocks
+            if (start is None or block.end >= start) and (end is None or block.start < end)
+        ]
+
+    def _decode(self, block: BlockInfo) -> Iterator[TransactionRecord]:
+        data = self.read_block(block)
+        columns = data.columns
+        enchant_values = [enchant_value(key) for key in data.enchants]
+        for i in range(block.rows):
+            levels, material, pattern = enchant_values[columns["enchants"][i]]
+            yield TransactionRecord(
+                columns["sold_at"][i],
+                data.prices[i],
+                columns["count"][i],
+                data.items[columns["item"][i]],
+                levels,
+                material,
+                pattern,
+                data.seller_uuids[columns["seller_uuid"][i]],
+                data.seller_names[columns["seller_name"][i]],
+            )
+
+    def __iter__(self) -> Iterator[TransactionRecord]:
+        for block in self.blocks:
+            yield from self._decode(block)
+
+    def between(self, start: int | None = None, end: int | None = None) -> Iterator[TransactionRecord]:
+        for block in self.blocks_between(start, end):
+            for record in self._decode(block):
+                if (start is None or record.sold_at >= start) and (end is None or record.sold_at < end):
+                    yield record
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> TransactionLogReader:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
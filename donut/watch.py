@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from .models import AuctionEntry, PurchaseItem
+from .models.intern import item_fingerprint
+
+T = TypeVar("T")
+
+TransactionKey = tuple[Any, ...]
+
+
+def transaction_key(purchase: PurchaseItem | dict[str, Any]) -> TransactionKey:
+    if isinstance(purchase, dict):
+        item = purchase.get("item") or {}
+        seller = purchase.get("seller") or {}
+        return (
+            item_fingerprint(item or None),
+            item.get("count"),
+            purchase.get("price"),
+            seller.get("uuid"),
+            purchase.get("unixMillisDateSold"),
+        )
+    item_, seller_ = purchase.item, purchase.seller
+    return (
+        item_fingerprint(item_),
+        item_.count if item_ else None,
+        purchase.price,
+        seller_.uuid if seller_ else None,
+        purchase.unixMillisDateSold,
+    )
+
+
+def listing_key(entry: AuctionEntry | dict[str, Any]) -> TransactionKey:
+    if isinstance(entry, dict):
+        item = entry.get("item") or {}
+        seller = entry.get("seller") or {}
+        return item_fingerprint(item or None), item.get("count"), entry.get("price"), seller.get("uuid")
+    item_, seller_ = entry.item, entry.seller
+    return item_fingerprint(item_), item_.count if item_ else None, entry.price, seller_.uuid if seller_ else None
+
+
+def sold_at(purchase: PurchaseItem | dict[str, Any]) -> float | None:
+    millis = purchase.get("unixMillisDateSold") if isinstance(purchase, dict) else purchase.unixMillisDateSold
+    return millis / 1000 if millis else None
+
+
+class SeenSet:
+    def __init__(self, max_age: float = 180, max_entries: int = 100_000):
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._order: deque[tuple[float, Hashable]] = deque()
+        self._keys: dict[Hashable, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def _expire(self, now: float) -> None:
+        order, keys = self._order, self._keys
+        cutoff = now - self.max_age
+        while order and (order[0][0] < cutoff or len(order) > self.max_entries):
+            _, key = order.popleft()
+            last_seen = keys[key]
+            if last_seen >= cutoff and len(order) < self.max_entries:
+                order.append((last_seen, key))
+            else:
+                del keys[key]
+
+    def add(self, key: Hashable) -> bool:
+        now = time.monotonic()
+        new = key not in self._keys
+        self._keys[key] = now
+        if new:
+            self._order.append((now, key))
+        self._expire(now)
+        return new
+
+
+class PollCadence:
+    def __init__(
+        self,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        budget_share: float | None = 0.25,
+        target_items: float = 10,
+        smoothing: float = 0.3,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.budget_share = budget_share
+        self.target_items = target_items
+        self.smoothing = smoothing
+        self.interval = min_interval
+        self.rate = 0.0
+        self.lag = 0.0
+        self.behind = False
+        self.polls = 0
+        self.requests = 0
+        self.items = 0
+        self._budget: float | None = None
+        self._last: float | None = None
+
+    @classmethod
+    def fixed(cls, interval: float) -> PollCadence:
+        return cls(interval, interval, budget_share=None)
+
+    def bind(self, requests_per_second: float) -> None:
+        self._budget = requests_per_second * self.budget_share if self.budget_share is not None else None
+
+    def floor(self, requests: int = 1) -> float:
+        if not self._budget:
+            return self.min_interval
+        return max(self.min_interval, requests / self._budget)
+
+    def observe(self, new: int, requests: int, behind: bool = False, oldest: float | None = None) -> float:
+        now = time.monotonic()
+        elapsed = now - self._last if self._last is not None else 0.0
+        self._last = now
+        self.polls += 1
+        self.requests += requests
+        self.items += new
+        if elapsed > 0:
+            self.rate += self.smoothing * (new / elapsed - self.rate)
+        self.lag = max(0.0, time.time() - oldest) if oldest is not None else 0.0
+        self.behind = behind
+
+        floor = self.floor(requests)
+        if behind:
+            interval = floor
+        elif self.rate > 0:
+            interval = self.target_items / self.rate
+        else:
+            interval = self.interval * 2
+        self.interval = min(self.max_interval, max(floor, interval))
+        return self.interval
+
+    def __str__(self) -> str:
+        state = "behind" if self.behind else f"lag {self.lag:.1f}s"
+        return f"every {self.interval:.2f}s, {self.rate:.2f} new/s, {state}"
+
+
+async def poll_new(
+    fetch: Callable[[int], Awaitable[list[T]]],
+    key: Callable[[T], Hashable],
+    cadence: PollCadence,
+    seen: SeenSet,
+    max_pages: int = 5,
+    timestamp: Callable[[T], float | None] | None = None,
+) -> AsyncIterator[T]:
+    primed = False
+    while True:
+        fresh: list[T] = []
+        requests = 0
+        behind = False
+        for page in range(1, max_pages + 1):
+            items = await fetch(page)
+            requests += 1
+            new = [item for item in items if seen.add(key(item))]
+            fresh.extend(new)
+            if not primed or not items or len(new) < len(items):
+                break
+        else:
+            behind = True
+
+        stamps = [stamp for item in fresh if (stamp := timestamp(item)) is not None] if timestamp and primed else []
+        cadence.observe(len(fresh) if primed else 0, requests, behind, min(stamps, default=None))
+        primed = True
+        for item in reversed(fresh):
+            yield item
+        await asyncio.sleep(cadence.interval)
@@ -14,16 +14,13 @@ async def main():
     print("Keys: ", len(keys))
     async with DonutClient(keys) as client:
         start = time.time()
-        leaderboards = await client.leaderboards.batch("money", 1, 260)
-
-        total = 0
-        for leaderboard in leaderboards:
-            for entry in leaderboard:
-                total += entry.value
+        snapshot = await client.leaderboards.snapshot("money", 1, 260)
+        total = snapshot.sum()
 
         end = time.time()
         formatted_total = format_number(total)
         print(f"Total: {formatted_total} in Time taken: {end - start} seconds")
+        print(f"Median: {format_number(snapshot.percentile(50))} | Top: {snapshot.top_n(1)[0]}")
         
 
 if __name__ == "__main__":
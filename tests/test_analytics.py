@@ -0,0 +1,73 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from donut.analytics import TransactionFrame, benchmark  # noqa: E402
+from donut.txlog import TransactionLog  # noqa: E402
+
+BASE = 1_700_000_000_000
+
+
+def sale(item: str, price: float, at: int, count: int = 1) -> dict:
+    return {"item": {"id": item, "count": count}, "price": price, "seller": {"uuid": "u"}, "unixMillisDateSold": BASE + at}
+
+
+SALES = [
+    sale("minecraft:elytra", 100, 0),
+    sale("minecraft:elytra", 300, 1000),
+    sale("minecraft:elytra", 200, 2000),
+    sale("minecraft:diamond", 640, 500, count=64),
+    sale("minecraft:diamond", 20, 1500, count=2),
+]
+
+
+class TestTransactionFrame:
+    def test_item_stats(self):
+        stats = TransactionFrame.from_purchases(SALES).item_stats()
+        by_item = {item[0]: i for i, item in enumerate(stats.items)}
+        elytra, diamond = by_item["minecraft:elytra"], by_item["minecraft:diamond"]
+        assert stats.sales[elytra] == 3
+        assert stats.median[elytra] == 200
+        assert stats.vwap[elytra] == 200
+        assert stats.volume[diamond] == 66
+        assert stats.vwap[diamond] == pytest.approx(660 / 66)
+
+    def test_percentile(self):
+        frame = TransactionFrame.from_purchases(SALES)
+        position = [item[0] for item in frame.item_stats().items].index("minecraft:elytra")
+        assert frame.percentile(100)[position] == 300
+        assert frame.percentile(25)[position] == 150
+        with pytest.raises(ValueError):
+            frame.percentile(-1)
+
+    def test_rolling_volume(self):
+        frame = TransactionFrame.from_purchases(SALES)
+        rolling = frame.rolling_volume(window=2000, step=1000)
+        assert rolling.start.tolist() == [BASE, BASE + 1000, BASE + 2000]
+        assert rolling.sales.tolist() == [2, 4, 3]
+        elytra = frame.rolling_volume(window=1000, step=1000, item=("minecraft:elytra", (), None, None))
+        assert elytra.volume.tolist() == [1, 1, 1]
+        assert len(frame.rolling_volume(window=1000, step=1000, item=("minecraft:stone", (), None, None)).start) == 0
+
+    def test_outliers(self):
+        sales = [sale("minecraft:elytra", price, i) for i, price in enumerate([100, 101, 99, 102, 98, 100, 5000])]
+        assert TransactionFrame.from_purchases(sales).outliers().tolist() == [False] * 6 + [True]
+
+    def test_from_log_matches_purchases(self, tmp_path):
+        path = tmp_path / "sales.dtxl"
+        with TransactionLog(path, block_rows=2) as log:
+            log.extend(SALES)
+        frame = TransactionFrame.from_log(path)
+        assert len(frame) == 5
+        assert sorted(frame.items) == sorted(TransactionFrame.from_purchases(SALES).items)
+        assert sorted(frame.unit_price.tolist()) == sorted(TransactionFrame.from_purchases(SALES).unit_price.tolist())
+        windowed = TransactionFrame.from_log(path, start=BASE + 500, end=BASE + 2000)
+        assert sorted(windowed.price.tolist()) == [20, 300, 640]
+
+    def test_empty(self):
+        frame = TransactionFrame.from_purchases([])
+        assert frame.item_stats().items == []
+        assert len(frame.rolling_volume(1000, 1000).start) == 0
+
+    def test_benchmark(self):
+        assert set(benchmark(rows=10_000, items=10)) == {"item_stats", "p90", "rolling_volume", "outliers"}
@@ -0,0 +1,60 @@
+import time
+from pathlib import Path
+
+from donut.cache import MemoryCache, ResponseCache, SQLiteCache
+
+
+class TestMemoryCache:
+    def test_get_set(self):
+        cache = MemoryCache()
+        cache.set("a", b"1", 10)
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+
+    def test_expiry(self):
+        cache = MemoryCache()
+        cache.set("a", b"1", 0.001)
+        time.sleep(0.002)
+        assert cache.get("a") is None
+
+    def test_lru_eviction(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", b"1", 10)
+        cache.set("b", b"2", 10)
+        cache.get("a")
+        cache.set("c", b"3", 10)
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.evictions == 1
+
+
+class TestSQLiteCache:
+    def test_persists(self, tmp_path: Path):
+        path = tmp_path / "cache.db"
+        cache = SQLiteCache(path)
+        cache.set("a", b"1", 10)
+        cache.close()
+        assert SQLiteCache(path).get("a") == b"1"
+
+    def test_expiry(self, tmp_path: Path):
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("a", b"1", -1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestResponseCache:
+    def test_policies(self):
+        cache = ResponseCache()
+        assert cache.ttl_for("/v1/leaderboards/money/1") == 300
+        assert cache.ttl_for("/v1/auction/transactions/1") == 5
+        assert cache.ttl_for("/v1/unknown") == 0
+
+    def test_stats(self):
+        cache = ResponseCache()
+        assert cache.get("k") is None
+        cache.set("k", {"result": 1}, 10)
+        assert cache.get("k") == {"result": 1}
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
@@ -0,0 +1,39 @@
+import time
+
+from donut.deals import UnderpriceDetector
+from donut.pricing import PriceIndex
+
+ELYTRA = ("minecraft:elytra", (), None, None)
+
+
+def listing(price: float, count: int = 1, item: str = "minecraft:elytra") -> dict:
+    return {"item": {"id": item, "count": count, "contents": [{"id": "minecraft:stone"}] * 27}, "price": price, "seller": {"name": "Seller"}}
+
+
+class TestUnderpriceDetector:
+    def test_threshold_by_id_or_fingerprint(self):
+        detector = UnderpriceDetector(thresholds={"minecraft:elytra": 1000, ("minecraft:diamond", (), None, None): 10})
+        now = time.monotonic()
+        assert detector.check(listing(1500), now) is None
+        alert = detector.check(listing(1800, count=2), now)
+        assert alert is not None
+        assert (alert.item, alert.unit_price, alert.limit, alert.seller) == (ELYTRA, 900, 1000, "Seller")
+        assert alert.latency >= 0
+        assert detector.check(listing(500, count=64, item="minecraft:diamond"), now) is not None
+        assert detector.check(listing(1, item="minecraft:dirt"), now) is None
+        assert (detector.checked, detector.alerts) == (4, 2)
+
+    def test_reference_price_index(self):
+        index = PriceIndex()
+        sold = int(time.time() * 1000)
+        index.ingest([{"item": {"id": "minecraft:elytra"}, "price": price, "unixMillisDateSold": sold} for price in (1000, 1100, 900)])
+        detector = UnderpriceDetector(reference=index, discount=0.8)
+        assert detector.limit_for(ELYTRA) == 800
+        assert detector.check(listing(850), time.monotonic()) is None
+        alert = detector.check(listing(700), time.monotonic())
+        assert alert is not None
+        assert alert.listing.item.contents[0].id == "minecraft:stone"
+
+    def test_reference_mapping(self):
+        detector = UnderpriceDetector(thresholds={"minecraft:elytra": 100}, reference={"minecraft:elytra": 1000}, discount=0.5)
+        assert detector.limit_for(ELYTRA) == 500
@@ -0,0 +1,497 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from donut.deals import UnderpriceDetector
+from donut.endpoints import AuctionEndpoint, LeaderboardsEndpoint, LookupEndpoint, StatsEndpoint, normalize_username, stream_completed
+from donut.errors import IncompleteCrawlError, NotFoundError, ServerError, UnauthorizedError
+from donut.http import HTTPClient
+from donut.rankindex import PageIndex
+from donut.scheduler import Priority
+from donut.watch import PollCadence
+
+
+class FakeHTTP(HTTPClient):
+    def __init__(self, pages: int = 5, fail_pages: set[int] | None = None, rows: int = 1):
+        super().__init__("key", max_retries=0)
+        self.pages = pages
+        self.fail_pages = fail_pages or set()
+        self.rows = rows
+        self.overrides: dict[int, list[dict[str, Any]]] = {}
+        self.calls: list[str] = []
+        self.fail_error: Exception = ServerError("Server error: 500")
+        self.end_error: Exception | None = None
+
+    def leaderboard_page(self, page: int) -> list[dict[str, Any]]:
+        if page in self.overrides:
+            return self.overrides[page]
+        if self.rows == 1:
+            return [{"username": f"p{page}", "value": str(1000 - page)}]
+        start = (page - 1) * self.rows
+        return [{"username": f"player{start + i}", "value": str(100_000 - (start + i) * 10)} for i in range(self.rows)]
+
+    async def _send(self, method: str, endpoint: str, api_key: str, json: Any = None, params: Any = None) -> dict[str, Any]:
+        self.calls.append(endpoint)
+        await asyncio.sleep(0)
+        kind, *rest = endpoint.removeprefix("/v1/").split("/")
+        if kind == "leaderboards":
+            page = int(rest[1])
+            if page in self.fail_pages:
+                raise self.fail_error
+            if page > self.pages:
+                if self.end_error is not None:
+                    raise self.end_error
+                return {"status": 200, "result": []}
+            return {"status": 200, "result": self.leaderboard_page(page)}
+        if rest[0].startswith("missing"):
+            raise NotFoundError("Resource not found")
+        if kind == "stats":
+            money = 100_000 - int(rest[0][6:]) * 10 if rest[0].startswith("player") else 1
+            return {"status": 200, "result": {"money": str(money)}}
+        if kind == "lookup":
+            return {"status": 200, "result": {"username": rest[0]}}
+        return {}
+
+
+class SalesHTTP(HTTPClient):
+    def __init__(self, page_size: int = 3):
+        super().__init__("key", max_retries=0)
+        self.page_size = page_size
+        self.sales: list[dict[str, Any]] = []
+        self.calls: list[int] = []
+        self.priorities: list[str] = []
+
+    async def get(self, endpoint: str, json: dict[str, Any] | None = None, priority: Priority = "interactive", **params: Any) -> dict[str, Any]:
+        self.priorities.append(priority)
+        return await super().get(endpoint, json, priority, **params)
+
+    def sell(self, count: int) -> None:
+        for _ in range(count):
+            n = len(self.sales)
+            self.sales.insert(0, {"item": {"id": "minecraft:diamond", "count": 1}, "price": n, "unixMillisDateSold": n})
+
+    async def _send(self, method: str, endpoint: str, api_key: str, json: Any = None, params: Any = None) -> dict[str, Any]:
+        page = int(endpoint.rsplit("/", 1)[1])
+        self.calls.append(page)
+        start = (page - 1) * self.page_size
+        return {"status": 200, "result": self.sales[start:start + self.page_size]}
+
+
+class ListingsHTTP(SalesHTTP):
+    def sell(self, count: int) -> None:
+        for _ in range(count):
+            n = len(self.sales)
+            self.sales.insert(0, {"item": {"id": "minecraft:elytra", "count": 1}, "price": n, "seller": {"uuid": f"u{n}"}})
+
+
+class TestStreamCompleted:
+    async def test_yields_every_item(self):
+        async def double(x: int) -> int:
+            await asyncio.sleep(0.001 * (5 - x))
+            return x * 2
+
+        results = [pair async for pair in stream_completed(range(5), double, buffer=2)]
+        assert sorted(results) == [(i, i * 2) for i in range(5)]
+
+    async def test_bounded_buffer(self):
+        in_flight = 0
+        peak = 0
+
+        async def fetch(x: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return x
+
+        async for _ in stream_completed(range(20), fetch, buffer=3):
+            pass
+        assert peak == 3
+
+
+class TestLeaderboardsStream:
+    async def test_stream_pages(self):
+        endpoint = LeaderboardsEndpoint(FakeHTTP())
+        pages = {page: response async for page, response in endpoint.stream("money", 1, 3)}
+        assert sorted(pages) == [1, 2, 3]
+        assert pages[2][0].username == "p2"
+
+
+class TestStatsStream:
+    async def test_stream_sets_username(self):
+        endpoint = StatsEndpoint(FakeHTTP())
+        results = dict([pair async for pair in endpoint.stream(["a", "b"])])
+        assert results["a"].result is not None
+        assert results["a"].result.username == "a"
+
+
+class TestPlayerBatches:
+    def test_normalize_username(self):
+        assert normalize_username(" Hexay ") == "hexay"
+
+    async def test_batch_dedupes_case_variants(self):
+        http = FakeHTTP()
+        results = await StatsEndpoint(http).batch(["Hexay", "hexay", "other", "HEXAY"])
+        assert http.calls == ["/v1/stats/hexay", "/v1/stats/other"]
+        assert [result.result.username for result in results if result.result is not None] == ["Hexay", "hexay", "other", "HEXAY"]
+        assert results[0].result is not None and results[3].result is not None
+        assert results[0].result.money == results[3].result.money
+
+    async def test_stream_keeps_each_spelling(self):
+        http = FakeHTTP()
+        pairs = [pair async for pair in StatsEndpoint(http).stream(["Hexay", "HEXAY"], decode="raw")]
+        assert http.calls == ["/v1/stats/hexay"]
+        assert sorted(response["result"]["username"] for _, response in pairs) == ["HEXAY", "Hexay"]
+        assert all(response["result"]["username"] == username for username, response in pairs)
+
+    async def test_concurrent_spellings_keep_own_username(self):
+        http = FakeHTTP()
+        endpoint = StatsEndpoint(http)
+        first, second = await asyncio.gather(endpoint("Hexay"), endpoint("HEXAY"))
+        assert http.calls == ["/v1/stats/hexay"]
+        assert first.result is not None and second.result is not None
+        assert (first.result.username, second.result.username) == ("Hexay", "HEXAY")
+        raw = await asyncio.gather(endpoint("Other", decode="raw"), endpoint("OTHER", decode="raw"))
+        assert [r["result"]["username"] for r in raw] == ["Other", "OTHER"]
+
+    async def test_stream_fans_out(self):
+        http = FakeHTTP()
+        pairs = [pair async for pair in LookupEndpoint(http).stream(["A", "a", "b"])]
+        assert sorted(name for name, _ in pairs) == ["A", "a", "b"]
+        assert len(http.calls) == 2
+
+    async def test_batch_negative_cache(self):
+        http = FakeHTTP()
+        endpoint = StatsEndpoint(http)
+        first = await endpoint.batch(["missing1", "hexay"])
+        assert first[0].status == 404
+        assert first[0].result is None
+        await endpoint.batch(["Missing1"])
+        assert http.calls.count("/v1/stats/missing1") == 1
+
+    async def test_single_call_raises_from_negative_cache(self):
+        http = FakeHTTP()
+        endpoint = StatsEndpoint(http)
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                await endpoint("missing2")
+        assert http.calls == ["/v1/stats/missing2"]
+
+
+class TestDecodeModes:
+    async def test_raw_batch(self):
+        results = await StatsEndpoint(FakeHTTP()).batch(["Hexay", "missing3"], decode="raw")
+        assert results[0] == {"status": 200, "result": {"money": "1", "username": "Hexay"}}
+        assert results[1] == {"status": 404}
+
+    async def test_raw_and_validated_share_request(self):
+        http = FakeHTTP()
+        endpoint = LeaderboardsEndpoint(http)
+        raw, validated = await asyncio.gather(endpoint("money", 2, decode="raw"), endpoint("money", 2))
+        assert raw["result"][0]["value"] == "998"
+        assert validated[0].value == 998.0
+        assert len(http.calls) == 1
+
+
+class TestSnapshotAll:
+    async def test_interleaves_categories(self):
+        http = FakeHTTP(pages=6)
+        reports: list[tuple[str, int, int]] = []
+        snapshots = await LeaderboardsEndpoint(http).snapshot_all(
+            ["money", "kills", "shards"], pages={"money": 6, "kills": 4, "shards": 6}, buffer=1,
+            progress=lambda category, done, total: reports.append((category, done, total)),
+        )
+        assert {category: len(snapshot) for category, snapshot in snapshots.items()} == {"money": 6, "kills": 4, "shards": 6}
+        assert [call.split("/")[3] for call in http.calls[:6]] == ["money", "kills", "shards"] * 2
+        assert reports[-1] == ("shards", 6, 6)
+        assert ("kills", 4, 4) in reports
+
+    async def test_discovers_page_counts(self):
+        http = FakeHTTP(pages=7)
+        snapshots = await LeaderboardsEndpoint(http).snapshot_all()
+        assert len(snapshots) == 10
+        assert all(len(snapshot) == 7 for snapshot in snapshots.values())
+
+
+class TestCrawl:
+    async def test_finds_end(self):
+        http = FakeHTTP(pages=7)
+        snapshot = await LeaderboardsEndpoint(http).crawl("money", buffer=3)
+        assert len(snapshot) == 7
+        assert snapshot.usernames[0] == "p1"
+        assert len(http.calls) <= 7 + 3
+
+    async def test_resumes_from_checkpoint(self, tmp_path: Path):
+        checkpoint = tmp_path / "money.jsonl"
+        http = FakeHTTP(pages=6, fail_pages={2, 4})
+        with pytest.raises(IncompleteCrawlError) as exc:
+            await LeaderboardsEndpoint(http).crawl("money", checkpoint, buffer=2)
+        assert exc.value.missing_pages == [2, 4]
+
+        http = FakeHTTP(pages=6)
+        snapshot = await LeaderboardsEndpoint(http).crawl("money", checkpoint, buffer=2)
+        assert http.calls == ["/v1/leaderboards/money/2", "/v1/leaderboards/money/4"]
+        assert [snapshot.usernames[i] for i in range(len(snapshot))] == [f"p{i}" for i in range(1, 7)]
+
+
+    async def test_checkpoint_removed_after_complete_crawl(self, tmp_path: Path):
+        checkpoint = tmp_path / "money.jsonl"
+        await LeaderboardsEndpoint(FakeHTTP(pages=3)).crawl("money", checkpoint, buffer=2)
+        assert not checkpoint.exists()
+        http = FakeHTTP(pages=5)
+        snapshot = await LeaderboardsEndpoint(http).crawl("money", checkpoint, buffer=2)
+        assert len(snapshot) == 5
+        assert "/v1/leaderboards/money/1" in http.calls
+
+    async def test_not_found_ends_crawl(self):
+        http = FakeHTTP(pages=4)
+        http.end_error = NotFoundError("Resource not found")
+        snapshot = await LeaderboardsEndpoint(http).crawl("money", buffer=1)
+        assert len(snapshot) == 4
+
+    async def test_unauthorized_stops_crawl(self):
+        http = FakeHTTP(pages=1000, fail_pages=set(range(1, 1001)))
+        http.fail_error = UnauthorizedError("Invalid or missing API key")
+        with pytest.raises(UnauthorizedError):
+            await LeaderboardsEndpoint(http).crawl("money", buffer=4)
+        assert len(http.calls) <= 4
+
+    async def test_outage_stops_after_max_failures(self, tmp_path: Path):
+        http = FakeHTTP(pages=1000, fail_pages=set(range(1, 1001)))
+        with pytest.raises(IncompleteCrawlError) as exc:
+            await LeaderboardsEndpoint(http).crawl("money", tmp_path / "money.jsonl", buffer=4, max_failures=10)
+        assert len(http.calls) <= 10 + 4
+        assert exc.value.missing_pages == sorted(exc.value.missing_pages) and len(exc.value.missing_pages) >= 10
+
+
+class TestPageCount:
+    @pytest.mark.parametrize("pages", [0, 1, 2, 7, 64, 1000])
+    async def test_page_count(self, pages: int):
+        http = FakeHTTP(pages=pages)
+        assert await LeaderboardsEndpoint(http).page_count("money") == pages
+        assert len(http.calls) <= 2 * max(pages, 1).bit_length() + 2
+
+    async def test_cached(self):
+        http = FakeHTTP(pages=100)
+        endpoint = LeaderboardsEndpoint(http)
+        await endpoint.page_count("money")
+        calls = len(http.calls)
+        assert await endpoint.page_count("money") == 100
+        assert len(http.calls) == calls
+
+    async def test_expired_uses_hint(self):
+        http = FakeHTTP(pages=100)
+        endpoint = LeaderboardsEndpoint(http)
+        await endpoint.page_count("money")
+        http.pages = 90
+        http.calls.clear()
+        assert await endpoint.page_count("money", ttl=0) == 90
+        assert len(http.calls) <= 9
+
+
+class TestRankOf:
+    async def test_by_value(self):
+        http = FakeHTTP(pages=200, rows=45)
+        endpoint = LeaderboardsEndpoint(http)
+        result = await endpoint.rank_of("money", value=100_000 - 1000 * 10 - 5)
+        assert result is not None
+        assert result.rank == 1002
+        assert result.page == 23
+
+    async def test_extremes(self):
+        endpoint = LeaderboardsEndpoint(FakeHTTP(pages=10, rows=45))
+        top = await endpoint.rank_of("money", value=10**9)
+        bottom = await endpoint.rank_of("money", value=-1)
+        assert top is not None and top.rank == 1
+        assert bottom is not None and bottom.rank == 451
+
+    async def test_by_username(self):
+        endpoint = LeaderboardsEndpoint(FakeHTTP(pages=200, rows=45))
+        result = await endpoint.rank_of("money", username="Player4321")
+        assert result is not None
+        assert (result.rank, result.username, result.page) == (4322, "player4321", 97)
+        assert result.requests == len(endpoint._http.calls)
+
+    async def test_warm_index_reused(self, tmp_path: Path):
+        path = tmp_path / "index.json"
+        endpoint = LeaderboardsEndpoint(FakeHTTP(pages=200, rows=45), PageIndex(path))
+        cold = await endpoint.rank_of("money", value=50_000.5)
+        assert cold is not None and cold.requests == len(endpoint._http.calls) > 2
+
+        http = FakeHTTP(pages=200, rows=45)
+        warm_endpoint = LeaderboardsEndpoint(http, PageIndex(path))
+        warm = await warm_endpoint.rank_of("money", value=50_000.5, exact=False)
+        assert warm is not None
+        assert warm.rank == cold.rank
+        assert warm.requests == 0
+        assert http.calls == []
+
+    def test_requires_one_argument(self):
+        with pytest.raises(ValueError):
+            asyncio.run(LeaderboardsEndpoint(FakeHTTP()).rank_of("money"))
+
+
+class TestEstimateTotal:
+    async def test_probes_within_budget(self):
+        endpoint = LeaderboardsEndpoint(FakeHTTP(pages=2000, rows=45))
+        estimate = await endpoint.estimate_total("money", max_requests=40)
+        assert estimate.pages == 2000
+        assert estimate.requests == len(endpoint._http.calls) <= 40
+
+    async def test_explicit_end_page_skips_probes(self):
+        endpoint = LeaderboardsEndpoint(FakeHTTP(pages=2000, rows=45))
+        estimate = await endpoint.estimate_total("money", max_requests=10, end_page=2000)
+        assert estimate.requests == len(endpoint._http.calls) <= 10
+
+
+class TestRefresh:
+    async def test_unchanged(self):
+        http = FakeHTTP(pages=100, rows=45)
+        endpoint = LeaderboardsEndpoint(http)
+        previous = await endpoint.snapshot("money", 1, 100)
+        snapshot, diff = await endpoint.refresh(previous)
+        assert diff.changes == []
+        assert diff.pages_fetched == 8
+        assert list(snapshot.values) == list(previous.values)
+
+    async def test_refetches_changed_region(self):
+        http = FakeHTTP(pages=100, rows=45)
+        endpoint = LeaderboardsEndpoint(http)
+        previous = await endpoint.snapshot("money", 1, 100)
+        rows = http.leaderboard_page(20)
+        rows[0], rows[1] = {**rows[1], "value": "99999"}, rows[0]
+        http.overrides[20] = rows
+        http.overrides[17] = rows_17 = http.leaderboard_page(17)
+        rows_17[-1] = {**rows_17[-1], "value": "10"}
+
+        snapshot, diff = await endpoint.refresh(previous)
+        assert diff.pages_fetched == 8 + 30
+        assert {(c.username, c.old_rank, c.new_rank) for c in diff.moved} == {("player856", 857, 856), ("player855", 856, 857)}
+        assert [(c.username, c.old_value, c.new_value) for c in diff.value_changed] == [
+            ("player764", 92360.0, 10.0),
+            ("player856", 91440.0, 99999.0),
+        ]
+        assert snapshot.rank_of("player856") == 856
+        assert snapshot.value_of("player764") == 10
+
+    async def test_growth_and_shrink(self):
+        http = FakeHTTP(pages=20, rows=45)
+        endpoint = LeaderboardsEndpoint(http)
+        previous = await endpoint.snapshot("money", 1, 20)
+        http.pages = 22
+        grown, diff = await endpoint.refresh(previous)
+        assert len(grown) == 22 * 45
+        assert len(diff.added) == 90
+
+        http.pages = 19
+        shrunk, diff = await endpoint.refresh(grown)
+        assert len(shrunk) == 19 * 45
+        assert len(diff.removed) == 135
+
+
+class SearchHTTP(SalesHTTP):
+    def __init__(self, listings: int, page_size: int = 3):
+        super().__init__(page_size)
+        self.sales = [{"item": {"id": f"minecraft:item{n % 2}"}, "price": n} for n in range(listings)]
+
+
+class TestSearchAll:
+    async def test_collects_every_page(self):
+        http = SearchHTTP(10)
+        entries = [entry async for entry in AuctionEndpoint(http).search_all("elytra", concurrency=2)]
+        assert [entry.price for entry in entries] == list(range(10))
+
+    async def test_limit_stops_requests(self):
+        http = SearchHTTP(300)
+        entries = [entry async for entry in AuctionEndpoint(http).search_all(limit=4, concurrency=3)]
+        assert [entry.price for entry in entries] == [0, 1, 2, 3]
+        await asyncio.sleep(0)
+        assert len(http.calls) <= 4
+
+    async def test_predicate_and_price_bound(self):
+        http = SearchHTTP(300)
+        endpoint = AuctionEndpoint(http)
+        entries = [
+            entry.price
+            async for entry in endpoint.search_all(
+                sort="lowest_price", max_price=20, predicate=lambda entry: entry.item.id.endswith("1"), concurrency=2
+            )
+        ]
+        assert entries == list(range(1, 20, 2))
+        await asyncio.sleep(0)
+        assert len(http.calls) <= 9
+
+    async def test_pages_use_bulk_lane(self):
+        http = SearchHTTP(10)
+        endpoint = AuctionEndpoint(http)
+        [entry async for entry in endpoint.search_all(concurrency=2)]
+        await endpoint.list(1, decode="raw")
+        assert set(http.priorities[:-1]) == {"bulk"}
+        assert http.priorities[-1] == "interactive"
+
+
+class TestWatchTransactions:
+    async def test_dedupes_and_catches_up(self):
+        http = SalesHTTP()
+        http.sell(5)
+        watcher = AuctionEndpoint(http).watch_transactions(cadence=0)
+
+        first = [await anext(watcher) for _ in range(3)]
+        assert [sale.price for sale in first] == [2, 3, 4]
+        assert http.calls == [1]
+
+        http.sell(2)
+        assert [(await anext(watcher)).price for _ in range(2)] == [5, 6]
+        assert http.calls == [1, 1]
+
+        http.sell(7)
+        assert [(await anext(watcher)).price for _ in range(7)] == list(range(7, 14))
+        assert http.calls == [1, 1, 1, 2, 3]
+        assert set(http.priorities) == {"bulk"}
+        await watcher.aclose()
+
+    async def test_reports_behind(self):
+        http = SalesHTTP()
+        http.sell(3)
+        cadence = PollCadence.fixed(0)
+        watcher = AuctionEndpoint(http).watch_transactions(cadence=cadence, max_pages=2)
+        [await anext(watcher) for _ in range(3)]
+        http.sell(10)
+        [await anext(watcher) for _ in range(6)]
+        assert cadence.behind
+        assert cadence.items == 6
+        assert cadence.lag > 0
+        await watcher.aclose()
+
+    async def test_listings(self):
+        http = ListingsHTTP()
+        http.sell(2)
+        watcher = AuctionEndpoint(http).watch_listings(cadence=0)
+        assert [(await anext(watcher)).price for _ in range(2)] == [0, 1]
+        http.sell(1)
+        assert (await anext(watcher)).price == 2
+        await watcher.aclose()
+
+    async def test_underpriced(self):
+        http = ListingsHTTP()
+        http.sell(3)
+        detector = UnderpriceDetector(thresholds={"minecraft:elytra": 4})
+        watcher = AuctionEndpoint(http).watch_underpriced(detector, cadence=0)
+        assert [(await anext(watcher)).price for _ in range(3)] == [0, 1, 2]
+        http.sell(4)
+        alert = await anext(watcher)
+        assert alert.price == 3
+        assert alert.latency >= 0
+        assert (detector.checked, detector.alerts) == (4, 4)
+        await watcher.aclose()
+
+    async def test_raw_mode(self):
+        http = SalesHTTP()
+        http.sell(2)
+        watcher = AuctionEndpoint(http).watch_transactions(cadence=0, decode="raw")
+        sale = await anext(watcher)
+        assert sale["price"] == 0  # type: ignore[index]
+        await watcher.aclose()
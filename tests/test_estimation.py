@@ -0,0 +1,65 @@
+import math
+from typing import Any
+
+import pytest
+
+from donut.estimation import LeaderboardEstimator, PageSummary, exponential_regression_estimate, find_threshold
+
+PAGES = 2000
+
+
+def value_at(rank: int) -> float:
+    return 1e9 * math.exp(-rank / 5000) + 1000
+
+
+def page(number: int) -> dict[str, Any]:
+    if number > PAGES:
+        return {"result": []}
+    start = (number - 1) * 45
+    return {"result": [{"value": str(value_at(start + i))} for i in range(45)]}
+
+
+EXACT = math.fsum(value_at(rank) for rank in range(PAGES * 45))
+
+
+async def fetch(number: int) -> dict[str, Any]:
+    return page(number)
+
+
+class TestHelpers:
+    def test_page_summary(self):
+        summary = PageSummary.from_page({"result": [{"value": "3"}, {"value": 1}]})
+        assert summary == PageSummary(4, 3, 1)
+        assert PageSummary.from_page({"result": []}) == PageSummary(0, 0, 0)
+
+    def test_regression_flat(self):
+        assert exponential_regression_estimate(10, 10, 2) == (900, 0)
+
+    def test_threshold_bounds(self):
+        assert 0.8 <= find_threshold(1, 100, 1) <= 1
+
+
+class TestLeaderboardEstimator:
+    async def test_accuracy(self):
+        estimate = await LeaderboardEstimator(fetch, max_requests=500).estimate(1, PAGES)
+        assert estimate.requests <= 500
+        assert abs(estimate.total - EXACT) / EXACT < 0.01
+        assert estimate.pages == PAGES
+
+    async def test_respects_budget(self):
+        estimate = await LeaderboardEstimator(fetch, max_requests=10).estimate(1, PAGES)
+        assert estimate.requests <= 10
+        assert abs(estimate.total - EXACT) / EXACT < 0.1
+        assert estimate.uncertainty > 0
+
+    async def test_target_error_stops_early(self):
+        full = await LeaderboardEstimator(fetch, max_requests=500).estimate(1, PAGES)
+        rough = await LeaderboardEstimator(fetch, max_requests=500, target_error=0.05).estimate(1, PAGES)
+        assert rough.requests < full.requests
+        assert rough.relative_uncertainty <= 0.05
+
+    @pytest.mark.parametrize("end", [1, 2, 3])
+    async def test_small_ranges_exact(self, end: int):
+        estimate = await LeaderboardEstimator(fetch).estimate(1, end)
+        assert estimate.total == pytest.approx(math.fsum(value_at(rank) for rank in range(end * 45)))
+        assert estimate.uncertainty == 0
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from donut.cache import ResponseCache
+from donut.errors import NotFoundError, RateLimitedError, ServerError
+from donut.http import HTTPClient, parse_rate_limit_headers, parse_retry_after
+from donut.models import LeaderboardResponse
+from donut.ratelimit import RateLimiter
+
+
+class ScriptedHTTP(HTTPClient):
+    def __init__(self, responses: list[Any], keys: list[str] | None = None, **kwargs: Any):
+        super().__init__(keys or ["a", "b"], backoff=0.001, **kwargs)
+        self.responses = responses
+        self.keys_used: list[str] = []
+
+    async def _send(self, method: str, endpoint: str, api_key: str, json: Any = None, params: Any = None) -> dict[str, Any]:
+        self.keys_used.append(api_key)
+        await asyncio.sleep(0)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response  # type: ignore[no-any-return]
+
+
+class TestParseRetryAfter:
+    @pytest.mark.parametrize("value,expected", [(None, None), ("", None), ("5", 5.0), ("-1", 0.0), ("garbage", None)])
+    def test_parse(self, value: str | None, expected: float | None):
+        assert parse_retry_after(value) == expected
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestParseRateLimitHeaders:
+    def test_x_ratelimit(self):
+        headers = {"X-RateLimit-Limit": "250", "X-RateLimit-Remaining": "12", "X-RateLimit-Reset": "30"}
+        assert parse_rate_limit_headers(headers) == {"limit": 250, "remaining": 12, "reset": 30.0}
+
+    def test_epoch_reset(self):
+        reset = parse_rate_limit_headers({"RateLimit-Reset": str(time.time() + 10)})["reset"]
+        assert 9 < reset <= 10
+
+    def test_missing(self):
+        assert parse_rate_limit_headers({}) == {"limit": None, "remaining": None, "reset": None}
+
+
+class TestRetries:
+    async def test_retries_server_error(self):
+        http = ScriptedHTTP([ServerError("boom"), {"ok": True}])
+        assert await http.get("/x") == {"ok": True}
+
+    async def test_rate_limited_key_cooled_down(self):
+        http = ScriptedHTTP([RateLimitedError("slow", retry_after=60), {"ok": True}, {"ok": True}])
+        await http.get("/x")
+        await http.get("/x")
+        assert http.keys_used == ["a", "b", "b"]
+
+    async def test_gives_up_after_max_retries(self):
+        http = ScriptedHTTP([ServerError("boom")] * 3, max_retries=2)
+        with pytest.raises(ServerError):
+            await http.get("/x")
+
+    async def test_not_found_not_retried(self):
+        http = ScriptedHTTP([NotFoundError("missing"), {"ok": True}])
+        with pytest.raises(NotFoundError):
+            await http.get("/x")
+        assert len(http.keys_used) == 1
+
+
+class TestSingleFlight:
+    async def test_identical_requests_coalesced(self):
+        http = ScriptedHTTP([{"result": [{"value": 1}]}])
+        first, second = await asyncio.gather(
+            http.get_model(LeaderboardResponse, "/v1/leaderboards/money/1"),
+            http.get_model(LeaderboardResponse, "/v1/leaderboards/money/1"),
+        )
+        assert first is second
+        assert len(http.keys_used) == 1
+
+    async def test_different_params_not_coalesced(self):
+        http = ScriptedHTTP([{"a": 1}, {"b": 2}])
+        results = await asyncio.gather(http.get("/x", json={"search": "a"}), http.get("/x", json={"search": "b"}))
+        assert results == [{"a": 1}, {"b": 2}]
+
+    async def test_sequential_requests_not_coalesced(self):
+        http = ScriptedHTTP([{"a": 1}, {"b": 2}])
+        assert await http.get("/x") == {"a": 1}
+        assert await http.get("/x") == {"b": 2}
+
+    async def test_errors_shared(self):
+        http = ScriptedHTTP([NotFoundError("missing")])
+        results = await asyncio.gather(http.get("/x"), http.get("/x"), return_exceptions=True)
+        assert all(isinstance(r, NotFoundError) for r in results)
+
+
+class TestPriority:
+    async def test_interactive_skips_bulk_waiting_for_key(self):
+        http = ScriptedHTTP([{"n": i} for i in range(7)], keys=["a"])
+        http._rate_limiter = RateLimiter(["a"], 1, window=0.02)
+        order = []
+
+        async def fetch(name: str, priority: str) -> None:
+            await http.get(f"/{name}", priority=priority)  # type: ignore[arg-type]
+            order.append(name)
+
+        tasks = [asyncio.create_task(fetch(f"bulk{i}", "bulk")) for i in range(6)]
+        await asyncio.sleep(0.005)
+        tasks.append(asyncio.create_task(fetch("interactive", "interactive")))
+        await asyncio.gather(*tasks)
+        assert order.index("interactive") <= 1
+
+
+class TestResponseCaching:
+    async def test_cached_get(self):
+        cache = ResponseCache()
+        http = ScriptedHTTP([{"result": []}], cache=cache)
+        assert await http.get("/v1/leaderboards/money/1") == {"result": []}
+        assert await http.get("/v1/leaderboards/money/1") == {"result": []}
+        assert len(http.keys_used) == 1
+        assert cache.stats.hits == 1
+
+    async def test_uncached_endpoint(self):
+        http = ScriptedHTTP([{"a": 1}, {"a": 2}], cache=ResponseCache(policies={}))
+        await http.get("/v1/stats/a")
+        assert await http.get("/v1/stats/a") == {"a": 2}
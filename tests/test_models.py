@@ -1,19 +1,26 @@
+from datetime import timedelta
+
 import pytest
+from pydantic import ValidationError
 
 from donut.models import (
     AuctionEntry,
+    AuctionResponse,
     ContainerItem,
     Enchantments,
     Item,
     ItemData,
     LeaderboardEntry,
+    LeaderboardResponse,
     ListResponse,
     LookupResult,
     PurchaseItem,
     Seller,
     SingleResponse,
     Stats,
+    StatsResponse,
 )
+from donut.models.decode import decode
 
 
 class TestListResponse:
@@ -175,3 +182,70 @@ class TestStats:
         stats = Stats()
         assert str(stats) == ""
 
+    def test_parsed(self):
+        stats = Stats(money="1,234.5", kills="50", deaths="oops", playtime="5400000")
+        parsed = stats.parsed
+        assert parsed.money == 1234.5
+        assert parsed.kills == 50
+        assert parsed.deaths is None
+        assert parsed.playtime == timedelta(hours=1, minutes=30)
+        assert stats.parsed is parsed
+
+    def test_parsed_after_decode(self):
+        stats = decode(StatsResponse, {"result": {"shards": "12", "money": "7"}}).result
+        assert (stats.parsed.shards, stats.parsed.money, stats.parsed.playtime) == (12, 7.0, None)
+
+
+
+class TestDecode:
+    payload = {"status": 200, "result": [{"username": "Player", "value": "1500"}, {"username": "Other"}]}
+
+    def test_validated(self):
+        response = decode(LeaderboardResponse, self.payload, "validated")
+        assert response[0].value == 1500.0
+
+    def test_raw(self):
+        assert decode(LeaderboardResponse, self.payload, "raw") is self.payload
+
+
+class TestInterning:
+    def page(self) -> dict:
+        enchants = {"enchantments": {"levels": {"sharpness": 5, "unbreaking": 3}}, "trim": {"material": "gold"}}
+        item = {"id": "minecraft:diamond_sword", "lore": ["Forged"], "enchants": enchants}
+        return {"result": [{"item": item, "price": p, "seller": {"name": "Player", "uuid": "u1"}} for p in (100, 200)]}
+
+    def test_shares_identical_parts(self):
+        first, second = decode(AuctionResponse, self.page())
+        assert first.seller is second.seller
+        assert first.item.lore is not second.item.lore
+        assert first.item.lore[0] is second.item.lore[0]
+        assert first.item.enchants is second.item.enchants
+        assert first.item is not second.item
+
+    def test_shared_parts_are_read_only(self):
+        first, second = decode(AuctionResponse, self.page())
+        with pytest.raises(ValidationError):
+            first.seller.name = "changed"
+        with pytest.raises(TypeError):
+            first.item.enchants.enchantments.levels["sharpness"] = 1
+        assert second.seller.name == "Player"
+        assert second.item.fingerprint[1] == (("sharpness", 5), ("unbreaking", 3))
+        assert first.model_dump() == second.model_dump() | {"price": 100.0}
+
+    def test_keeps_each_enchantment_order(self):
+        first = Item.model_validate({"enchants": {"enchantments": {"levels": {"sharpness": 5, "unbreaking": 3}}}})
+        second = Item.model_validate({"enchants": {"enchantments": {"levels": {"unbreaking": 3, "sharpness": 5}}}})
+        assert str(first) == "Unknown [Sharpness 5, Unbreaking 3]"
+        assert str(second) == "Unknown [Unbreaking 3, Sharpness 5]"
+        assert first.fingerprint == second.fingerprint
+
+    def test_fingerprint(self):
+        entry = decode(AuctionResponse, self.page())[0]
+        assert entry.item.fingerprint == ("minecraft:diamond_sword", (("sharpness", 5), ("unbreaking", 3)), "gold", None)
+        assert hash(entry.item.fingerprint) == hash(Item.model_validate(self.page()["result"][1]["item"]).fingerprint)
+
+    def test_fingerprint_does_not_affect_equality_or_dump(self):
+        item = Item(id="minecraft:stone")
+        assert item.fingerprint == ("minecraft:stone", (), None, None)
+        assert item == Item(id="minecraft:stone")
+        assert "fingerprint" not in item.model_dump()
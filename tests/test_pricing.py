@@ -0,0 +1,97 @@
+import pytest
+
+from donut.models import AuctionEntry, Enchantments, Item, ItemData, PurchaseItem, Seller, Trim
+from donut.models.intern import item_fingerprint
+from donut.pricing import PriceIndex
+
+SWORD = ("minecraft:diamond_sword", (("sharpness", 5),), None, None)
+
+
+def listing(price: float, seller: str, count: int = 1, sharpness: int = 5) -> AuctionEntry:
+    enchants = ItemData(enchantments=Enchantments(levels={"sharpness": sharpness}))
+    item = Item(id="minecraft:diamond_sword", count=count, enchants=enchants)
+    return AuctionEntry(item=item, price=price, seller=Seller(uuid=seller))
+
+
+def sale(price: float, seller: str, at: float, count: int = 1) -> dict:
+    item = {"id": "minecraft:diamond_sword", "count": count, "enchants": {"enchantments": {"levels": {"sharpness": 5}}}}
+    return {"item": item, "price": price, "seller": {"uuid": seller}, "unixMillisDateSold": int(at * 1000)}
+
+
+class TestItemFingerprint:
+    def test_model_and_dict_agree(self):
+        enchants = ItemData(enchantments=Enchantments(levels={"unbreaking": 3, "mending": 1}), trim=Trim(material="gold"))
+        model = Item(id="minecraft:elytra", count=1, lore=["x"], enchants=enchants)
+        raw = {"id": "minecraft:elytra", "enchants": {"enchantments": {"levels": {"mending": 1, "unbreaking": 3}}, "trim": {"material": "gold"}}}
+        assert item_fingerprint(model) == item_fingerprint(raw) == ("minecraft:elytra", (("mending", 1), ("unbreaking", 3)), "gold", None)
+
+    def test_empty(self):
+        assert item_fingerprint(None) == item_fingerprint(Item()) == (None, (), None, None)
+
+
+class TestPriceIndex:
+    def test_min_ask_per_unit(self):
+        index = PriceIndex()
+        index.ingest([listing(300, "a"), listing(500, "b", count=2), listing(100, "c", sharpness=4)], now=0)
+        assert index.min_ask(SWORD) == 250
+        assert index.asks(SWORD) == [250, 300]
+        assert len(index) == 2
+
+    def test_relisting_is_idempotent(self):
+        index = PriceIndex()
+        index.add_listing(listing(300, "a"), now=0)
+        index.add_listing(listing(300, "a"), now=10)
+        assert index.price(SWORD).listings == 1
+
+    def test_sale_removes_listing(self):
+        index = PriceIndex()
+        index.add_listing(listing(300, "a"), now=0)
+        index.add_listing(listing(400, "b"), now=0)
+        index.add_sale(PurchaseItem.model_validate(sale(300, "a", at=5)), now=5)
+        price = index.price(SWORD)
+        assert (price.min_ask, price.listings, price.sales, price.median_sale) == (400, 1, 1, 300)
+
+    def test_rolling_sales(self):
+        index = PriceIndex(window=100)
+        index.ingest([sale(p, "s", at=t) for p, t in [(900, 70), (100, 1), (200, 60), (300, 50)]], now=70)
+        assert index.median_sale(SWORD) == 250
+        assert index.sale_percentile(SWORD, 100) == 900
+        index.evict(now=140)
+        assert index.median_sale(SWORD) == 300
+        assert index.volume(SWORD) == 3
+        index.evict(now=1000)
+        assert index.median_sale(SWORD) is None
+        assert len(index) == 0
+
+    def test_listing_expiry_respects_refresh(self):
+        index = PriceIndex(listing_ttl=10)
+        index.add_listing(listing(300, "a"), now=0)
+        index.add_listing(listing(400, "b"), now=0)
+        index.add_listing(listing(300, "a"), now=8)
+        index.evict(now=15)
+        assert index.asks(SWORD) == [300]
+
+    def test_evicts_as_events_arrive(self):
+        index = PriceIndex(window=100, listing_ttl=10)
+        index.add_listing(listing(300, "a"), now=0)
+        index.add_sale(sale(500, "s", at=20), now=20)
+        assert index.asks(SWORD) == []
+        index.add_sale(sale(700, "s", at=150), now=150)
+        assert (index.median_sale(SWORD), index.volume(SWORD)) == (700, 1)
+
+    def test_stale_sale_outside_window(self):
+        index = PriceIndex(window=10)
+        index.add_sale(sale(5, "s", at=1))
+        assert index.median_sale(SWORD) is None
+        assert index.price(SWORD).volume == 0
+
+    def test_reobserved_listing_not_requeued(self):
+        index = PriceIndex(listing_ttl=10)
+        for now in range(100):
+            index.add_listing(listing(300, "a"), now=now)
+        assert len(index._listing_order) == 1
+        assert index.asks(SWORD) == [300]
+
+    def test_percentile_bounds(self):
+        with pytest.raises(ValueError):
+            PriceIndex().sale_percentile(SWORD, 101)
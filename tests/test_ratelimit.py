@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+from donut.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    def test_capacity(self):
+        limiter = RateLimiter(["a", "b"], requests_per_minute=10)
+        assert limiter.capacity == 20
+
+    def test_round_robin(self):
+        limiter = RateLimiter(["a", "b"], requests_per_minute=10)
+        assert [limiter.try_acquire() for _ in range(4)] == ["a", "b", "a", "b"]
+
+    def test_skips_exhausted_key(self):
+        limiter = RateLimiter(["a", "b"], requests_per_minute=1)
+        limiter.record("a")
+        assert limiter.try_acquire() == "b"
+        assert limiter.try_acquire() is None
+
+    def test_wait_time(self):
+        limiter = RateLimiter(["a"], requests_per_minute=1, window=10)
+        assert limiter.wait_time() == 0
+        limiter.try_acquire()
+        assert 9 < limiter.wait_time() <= 10
+
+    async def test_acquire_waits_for_window(self):
+        limiter = RateLimiter(["a"], requests_per_minute=2, window=0.1)
+        start = time.monotonic()
+        keys = [await limiter.acquire() for _ in range(4)]
+        assert keys == ["a"] * 4
+        assert time.monotonic() - start >= 0.1
+
+    async def test_interactive_served_before_queued_bulk(self):
+        limiter = RateLimiter(["a"], requests_per_minute=1, window=0.05)
+        await limiter.acquire("bulk")
+        order = []
+
+        async def job(name: str, priority: str) -> None:
+            await limiter.acquire(priority)  # type: ignore[arg-type]
+            order.append(name)
+
+        tasks = [asyncio.create_task(job(f"bulk{i}", "bulk")) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(job("interactive", "interactive")))
+        await asyncio.sleep(0)
+        assert limiter.queued("bulk") == 3 and limiter.queued("interactive") == 1
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "bulk0", "bulk1", "bulk2"]
+
+    async def test_cancelled_waiter_removed(self):
+        limiter = RateLimiter(["a"], requests_per_minute=1, window=0.05)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire("bulk"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert limiter.queued() == 0
+        assert await limiter.acquire() == "a"
+
+    def test_per_key_limits(self):
+        limiter = RateLimiter(["a", "b"], requests_per_minute={"a": 1, "b": 3})
+        assert limiter.capacity == 4
+        keys = [limiter.try_acquire() for _ in range(5)]
+        assert keys == ["a", "b", "b", "b", None]
+
+    def test_cooldown(self):
+        limiter = RateLimiter(["a", "b"], requests_per_minute=10)
+        limiter.cooldown("a", 10)
+        assert [limiter.try_acquire() for _ in range(3)] == ["b", "b", "b"]
+
+    def test_update_from_server(self):
+        limiter = RateLimiter(["a"], requests_per_minute=10)
+        limiter.update("a", limit=100, remaining=1, reset=5)
+        assert limiter.capacity == 100
+        assert limiter.try_acquire() == "a"
+        assert limiter.try_acquire() is None
+        assert 4 < limiter.wait_time() <= 5
+
+    def test_expired_server_budget_ignored(self):
+        limiter = RateLimiter(["a"], requests_per_minute=10)
+        limiter.update("a", remaining=0, reset=0)
+        assert limiter.try_acquire() == "a"
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from donut.scheduler import Scheduler
+
+
+class TestScheduler:
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            Scheduler(0)
+
+    async def test_caps_in_flight(self):
+        scheduler = Scheduler(max_in_flight=4)
+        peak = 0
+
+        async def job() -> None:
+            nonlocal peak
+            async with scheduler.slot("bulk"):
+                peak = max(peak, scheduler.in_flight)
+                await asyncio.sleep(0.001)
+
+        await asyncio.gather(*[job() for _ in range(20)])
+        assert peak == 3
+        assert scheduler.in_flight == 0
+
+    async def test_interactive_jumps_bulk_queue(self):
+        scheduler = Scheduler(max_in_flight=1)
+        order: list[str] = []
+        await scheduler.acquire("bulk")
+
+        async def job(name: str, priority: str) -> None:
+            async with scheduler.slot(priority):  # type: ignore[arg-type]
+                order.append(name)
+
+        tasks = [asyncio.create_task(job("bulk", "bulk")), asyncio.create_task(job("interactive", "interactive"))]
+        await asyncio.sleep(0)
+        assert scheduler.queued() == 2
+        scheduler.release("bulk")
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "bulk"]
+
+    async def test_reserved_slot_for_interactive(self):
+        scheduler = Scheduler(max_in_flight=2, reserved=1)
+        await scheduler.acquire("bulk")
+        waiter = asyncio.create_task(scheduler.acquire("bulk"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await asyncio.wait_for(scheduler.acquire("interactive"), 1)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.queued() == 0
@@ -0,0 +1,72 @@
+import pytest
+
+from donut.models import LeaderboardEntry, LeaderboardResponse
+from donut.snapshot import LeaderboardSnapshot, SnapshotBuilder, StringTable
+
+
+def make_page(page: int, size: int = 3) -> dict:
+    start = (page - 1) * size
+    return {"result": [{"username": f"P{start + i}", "uuid": f"u{start + i}", "value": str(100 - start - i)} for i in range(size)]}
+
+
+class TestStringTable:
+    def test_indexing(self):
+        table = StringTable(["a", "", "ccc"])
+        assert len(table) == 3
+        assert [table[0], table[1], table[2], table[-1]] == ["a", "", "ccc", "ccc"]
+        assert list(table) == ["a", "", "ccc"]
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            StringTable(["a"])[1]
+
+
+class TestLeaderboardSnapshot:
+    def snapshot(self) -> LeaderboardSnapshot:
+        builder = SnapshotBuilder("money", page_size=3)
+        for page in (2, 1, 3):
+            builder.add(page, make_page(page))
+        return builder.build()
+
+    def test_build_orders_pages(self):
+        snapshot = self.snapshot()
+        assert len(snapshot) == 9
+        assert list(snapshot.values) == [100.0 - i for i in range(9)]
+        assert list(snapshot.ranks) == list(range(1, 10))
+        assert snapshot[4] == LeaderboardEntry(username="P4", uuid="u4", value=96)
+
+    def test_aggregates(self):
+        snapshot = self.snapshot()
+        assert snapshot.sum() == sum(100 - i for i in range(9))
+        assert snapshot.percentile(0) == 92
+        assert snapshot.percentile(100) == 100
+        assert snapshot.percentile(50) == 96
+        assert [entry.username for entry in snapshot.top_n(2)] == ["P0", "P1"]
+
+    def test_rank_lookup(self):
+        snapshot = self.snapshot()
+        assert snapshot.rank_of("p3") == 4
+        assert snapshot.value_of("P3") == 97
+        assert snapshot.rank_of("nobody") is None
+        assert snapshot.rank_for_value(96.5) == 5
+        assert snapshot.count_at_least(96) == 5
+
+    def test_rows_for_page(self):
+        snapshot = self.snapshot()
+        assert snapshot.page_count(page_size=3) == 3
+        assert snapshot.rows_for_page(2, page_size=3) == [("P3", "u3", 97.0), ("P4", "u4", 96.0), ("P5", "u5", 95.0)]
+        assert snapshot.rows_for_page(4, page_size=3) == []
+
+    def test_from_models_and_gaps(self):
+        pages = {1: LeaderboardResponse.model_validate(make_page(1, 45)), 3: make_page(3, 45)}
+        snapshot = LeaderboardSnapshot.from_pages(pages)
+        assert len(snapshot) == 90
+        assert snapshot.ranks[45] == 91
+
+    def test_empty_pages_skipped(self):
+        snapshot = LeaderboardSnapshot.from_pages([make_page(1), {"result": []}])
+        assert len(snapshot) == 3
+
+    def test_percentile_bounds(self):
+        with pytest.raises(ValueError):
+            self.snapshot().percentile(101)
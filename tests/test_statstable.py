@@ -0,0 +1,33 @@
+import math
+
+from donut.models import StatsResponse
+from donut.statstable import StatsTable
+
+RESPONSES = [
+    StatsResponse.model_validate({"result": {"username": "alice", "money": "100.5", "kills": "3", "playtime": "7200000"}}),
+    {"result": {"username": "bob", "money": "2,000", "kills": "9"}},
+    {"status": 404},
+]
+
+
+class TestStatsTable:
+    def test_columns(self):
+        table = StatsTable.from_responses(RESPONSES)
+        assert len(table) == 3
+        assert table.usernames == ["alice", "bob", None]
+        assert table["money"][:2].tolist() == [100.5, 2000.0]
+        assert math.isnan(table["money"][2])
+        assert table["playtime"][0] == 7200.0
+        assert math.isnan(table["playtime"][1])
+
+    def test_aggregates(self):
+        table = StatsTable.from_responses(RESPONSES)
+        assert table.sum("kills") == 12
+        assert table.top("money", 1) == [("bob", 2000.0)]
+        assert table.rank("kills") == [1, 0]
+
+    def test_rows(self):
+        rows = list(StatsTable.from_responses(RESPONSES).rows())
+        assert rows[1]["money"] == 2000.0
+        assert rows[1]["playtime"] is None
+        assert rows[2]["username"] is None
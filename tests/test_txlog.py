@@ -0,0 +1,85 @@
+import pytest
+
+from donut.models import PurchaseItem
+from donut.models.intern import item_fingerprint
+from donut.txlog import TransactionLog, TransactionLogReader
+
+
+def sale(n: int) -> dict:
+    enchants = {"enchantments": {"levels": {"sharpness": n % 3 + 1}}} if n % 2 else None
+    return {
+        "item": {"id": f"minecraft:item{n % 5}", "count": n % 4 + 1, "enchants": enchants, "lore": ["dropped"]},
+        "price": 1000.0 + n,
+        "seller": {"name": f"seller{n % 7}", "uuid": f"uuid{n % 7}"},
+        "unixMillisDateSold": 1_700_000_000_000 + n * 1000,
+    }
+
+
+class TestTransactionLog:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "sales.dtxl"
+        with TransactionLog(path, block_rows=64) as log:
+            log.extend(sale(n) for n in range(200))
+            log.append(PurchaseItem.model_validate(sale(200)))
+
+        with TransactionLogReader(path) as reader:
+            assert len(reader) == 201
+            assert len(reader.blocks) == 4
+            records = list(reader)
+        assert [r.price for r in records] == [1000.0 + n for n in range(201)]
+        record = records[3]
+        assert (record.item_id, record.quantity, record.seller_name, record.seller_uuid) == ("minecraft:item3", 4, "seller3", "uuid3")
+        assert record.fingerprint == item_fingerprint(PurchaseItem.model_validate(sale(3)).item)
+        assert record.unit_price == 1003.0 / 4
+
+    def test_appends_across_sessions(self, tmp_path):
+        path = tmp_path / "sales.dtxl"
+        for chunk in (range(0, 10), range(10, 20)):
+            with TransactionLog(path) as log:
+                log.extend(sale(n) for n in chunk)
+        with TransactionLogReader(path) as reader:
+            assert [r.price for r in reader] == [1000.0 + n for n in range(20)]
+
+    def test_time_range_skips_blocks(self, tmp_path):
+        path = tmp_path / "sales.dtxl"
+        with TransactionLog(path, block_rows=10) as log:
+            log.extend(sale(n) for n in range(100))
+        with TransactionLogReader(path) as reader:
+            start = 1_700_000_000_000 + 25_000
+            records = list(reader.between(start, start + 10_000))
+        assert [r.price for r in records] == [1000.0 + n for n in range(25, 35)]
+
+    def test_ignores_truncated_tail(self, tmp_path):
+        path = tmp_path / "sales.dtxl"
+        with TransactionLog(path, block_rows=10) as log:
+            log.extend(sale(n) for n in range(20))
+        data = path.read_bytes()
+        path.write_bytes(data[:-5])
+        with TransactionLogReader(path) as reader:
+            assert len(reader) == 10
+
+    def test_recovers_after_torn_block(self, tmp_path):
+        path = tmp_path / "sales.dtxl"
+        with TransactionLog(path, block_rows=10) as log:
+            log.extend(sale(n) for n in range(20))
+        path.write_bytes(path.read_bytes()[:-5])
+        with TransactionLog(path) as log:
+            log.extend(sale(n) for n in range(20, 24))
+        with TransactionLogReader(path) as reader:
+            assert [r.price for r in reader] == [1000.0 + n for n in (*range(10), *range(20, 24))]
+
+    def test_rejects_corrupt_block(self, tmp_path):
+        path = tmp_path / "sales.dtxl"
+        with TransactionLog(path, block_rows=10) as log:
+            log.extend(sale(n) for n in range(20))
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with TransactionLogReader(path) as reader:
+            assert len(reader) == 10
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a log")
+        with pytest.raises(ValueError):
+            TransactionLogReader(path)
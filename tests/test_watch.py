@@ -0,0 +1,82 @@
+import time
+
+from donut.models import Item, PurchaseItem, Seller
+from donut.watch import PollCadence, SeenSet, poll_new, transaction_key
+
+
+class TestTransactionKey:
+    def test_model_and_dict_agree(self):
+        raw = {"item": {"id": "minecraft:elytra", "count": 1}, "price": 5e6, "seller": {"uuid": "u1"}, "unixMillisDateSold": 42}
+        model = PurchaseItem(item=Item(id="minecraft:elytra", count=1), price=5e6, seller=Seller(uuid="u1"), unixMillisDateSold=42)
+        assert transaction_key(raw) == transaction_key(model)
+        assert transaction_key(PurchaseItem()) == ((None, (), None, None), None, None, None, None)
+
+
+class TestSeenSet:
+    def test_add_reports_new(self):
+        seen = SeenSet()
+        assert seen.add("a")
+        assert not seen.add("a")
+        assert "a" in seen
+
+    def test_bounded_by_size(self):
+        seen = SeenSet(max_entries=2)
+        for key in "abc":
+            seen.add(key)
+        assert len(seen) == 2
+        assert "a" not in seen
+
+    def test_expires_by_age(self):
+        seen = SeenSet(max_age=-1)
+        seen.add("a")
+        seen.add("b")
+        assert "a" not in seen
+
+    def test_resighting_refreshes_entry(self):
+        seen = SeenSet(max_age=0.05)
+        seen.add("a")
+        time.sleep(0.03)
+        assert not seen.add("a")
+        time.sleep(0.03)
+        assert seen.add("b")
+        assert "a" in seen
+
+    async def test_old_sales_on_first_page_not_reemitted(self):
+        pages = [[3, 2, 1], [3, 2, 1], [3, 2, 1], [4, 3, 2, 1]]
+
+        async def fetch(page: int) -> list[int]:
+            return pages.pop(0) if len(pages) > 1 else pages[0]
+
+        emitted = []
+        watcher = poll_new(fetch, lambda item: item, PollCadence.fixed(0.03), SeenSet(max_age=0.05), max_pages=1)
+        async for item in watcher:
+            emitted.append(item)
+            if item == 4:
+                break
+        await watcher.aclose()
+        assert emitted == [1, 2, 3, 4]
+
+
+class TestPollCadence:
+    def test_speeds_up_under_load(self):
+        cadence = PollCadence(min_interval=0.1, max_interval=30, budget_share=None, target_items=10)
+        cadence.observe(0, 1)
+        time.sleep(0.01)
+        interval = cadence.observe(50, 1)
+        assert interval == 0.1
+
+    def test_backs_off_when_quiet(self):
+        cadence = PollCadence(min_interval=1, max_interval=4, budget_share=None)
+        intervals = [cadence.observe(0, 1) for _ in range(4)]
+        assert intervals == [2, 4, 4, 4]
+
+    def test_budget_floor(self):
+        cadence = PollCadence(min_interval=0.1, budget_share=0.1)
+        cadence.bind(4.0)
+        assert cadence.observe(0, 1, behind=True) == 2.5
+        assert cadence.observe(0, 2, behind=True) == 5.0
+
+    def test_lag(self):
+        cadence = PollCadence()
+        cadence.observe(1, 1, oldest=time.time() - 5)
+        assert 4.5 < cadence.lag < 6